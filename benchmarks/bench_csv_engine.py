@@ -0,0 +1,83 @@
+"""
+Benchmark: pandas vs Arrow CSV parsing for the table metadata.
+
+Writes a tall CSV (few columns, many rows) and a wide CSV (many columns)
+and times the first-rows sample read and the full profile_csv pass with
+each engine.
+
+Run from the repository root:
+    python benchmarks/bench_csv_engine.py --rows 2000000 --wide-columns 200
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import helper_functions  # noqa: E402
+
+
+# function to write a synthetic table with n_columns measurement columns
+def make_csv(path, n_rows, n_columns, seed=0):
+    rng = np.random.default_rng(seed)
+    columns = {
+        "station": rng.integers(0, 500, n_rows),
+        "Date": pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 10**8, n_rows), unit="s"),
+        "site": rng.choice(["reef", "wadi", "coast", "island"], n_rows),
+    }
+    for i in range(n_columns):
+        columns[f"value_{i}"] = rng.normal(30, 5, n_rows).round(3)
+
+    pd.DataFrame(columns).to_csv(path, index=False)
+
+
+# function to time a callable over a few repeats
+def best_of(func, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows of the tall CSV (the wide one gets a tenth)")
+    parser.add_argument("--wide-columns", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    if not helper_functions.HAS_ARROW:
+        sys.exit("pyarrow is not installed")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tables = {
+            "tall": (os.path.join(tmp, "tall.csv"), args.rows, 5),
+            "wide": (os.path.join(tmp, "wide.csv"), args.rows // 10, args.wide_columns),
+        }
+
+        print(f"best of {args.repeats}\n")
+        print(f"{'table':<6} {'task':<14} {'engine':<7} {'rows':>11} {'seconds':>9} {'rows/s':>12}")
+
+        for name, (path, n_rows, n_columns) in tables.items():
+            make_csv(path, n_rows, n_columns)
+            size_mb = os.path.getsize(path) / 1024 ** 2
+            print(f"{name}: {n_rows:,} rows x {n_columns + 3} columns, {size_mb:,.0f} MB")
+
+            for engine in ("pandas", "arrow"):
+                tasks = {
+                    "sample 10k": lambda: len(helper_functions.read_csv_sample(path, 10_000, engine=engine)),
+                    "profile_csv": lambda: helper_functions.profile_csv(path, engine=engine)["row_count"],
+                }
+                for task, func in tasks.items():
+                    seconds, rows = best_of(func, args.repeats)
+                    print(f"{name:<6} {task:<14} {engine:<7} {rows:>11,} {seconds:>9.3f} {rows / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
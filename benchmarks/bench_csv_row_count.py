@@ -0,0 +1,81 @@
+"""
+Benchmark: CSV row counting for the table metadata.
+
+Writes a synthetic sensor export (a share of the rows carry a quoted
+comment with an embedded line break) and times the previous text line
+iteration against count_csv_rows in plain and quote-aware mode.
+
+Run from the repository root:
+    python benchmarks/bench_csv_row_count.py --rows 5000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import helper_functions  # noqa: E402
+
+
+# function to write a synthetic sensor export
+def make_csv(path, n_rows, multiline_share, seed=0):
+    rng = np.random.default_rng(seed)
+    comments = np.where(rng.random(n_rows) < multiline_share, "checked\nrecalibrated", "ok")
+
+    pd.DataFrame({
+        "station": rng.integers(0, 500, n_rows),
+        "Date": pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 10**8, n_rows), unit="s"),
+        "temperature": rng.normal(28, 3, n_rows).round(3),
+        "salinity": rng.normal(40, 1, n_rows).round(3),
+        "comment": comments,
+    }).to_csv(path, index=False)
+
+
+# function to count rows the way extract_table_metadata used to
+def count_text_lines(path):
+    with open(path, encoding="utf-8", errors="ignore") as f:
+        return sum(1 for _ in f) - 1
+
+
+# function to time a callable over a few repeats
+def best_of(func, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--multiline-share", type=float, default=0.01)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sensor_export.csv")
+        make_csv(path, args.rows, args.multiline_share)
+        size_mb = os.path.getsize(path) / 1024 ** 2
+
+        counters = {
+            "text lines (previous)": lambda: count_text_lines(path),
+            "binary blocks": lambda: helper_functions.count_csv_rows(path),
+            "binary blocks, quote-aware": lambda: helper_functions.count_csv_rows(path, quote_aware=True),
+        }
+
+        print(f"{args.rows:,} records, {size_mb:,.0f} MB, best of {args.repeats}\n")
+        print(f"{'counter':<28} {'rows':>12} {'seconds':>9} {'MB/s':>8}")
+
+        for name, counter in counters.items():
+            seconds, rows = best_of(counter, args.repeats)
+            print(f"{name:<28} {rows:>12,} {seconds:>9.3f} {size_mb / seconds:>8,.0f}")
+
+
+if __name__ == "__main__":
+    main()
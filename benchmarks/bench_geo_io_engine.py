@@ -0,0 +1,92 @@
+"""
+Benchmark: Arrow vs row-based reads for geo layer metadata extraction.
+
+Generates a polygon layer with a few attribute columns in a temporary
+GeoPackage and File Geodatabase, then times read_layer and
+read_vector_layer_metadata with every I/O engine.
+
+Run from the repository root:
+    python benchmarks/bench_geo_io_engine.py --features 200000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import helper_functions  # noqa: E402
+
+
+ENGINES = ["arrow", "pyogrio", "fiona"]
+
+
+# function to generate a synthetic survey layer
+def make_layer(n_features, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(34.5, 36.0, n_features)
+    y = rng.uniform(27.5, 29.0, n_features)
+
+    return gpd.GeoDataFrame(
+        {
+            "site_id": np.arange(n_features),
+            "species": rng.choice(["Corals", "Dugong", "Turtles", "Bird"], n_features),
+            "depth_m": rng.uniform(0, 40, n_features),
+            "Date_": pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 1500, n_features), unit="D"),
+        },
+        geometry=shapely.buffer(shapely.points(x, y), 0.001, quad_segs=4),
+        crs=4326,
+    )
+
+
+# function to time a callable over a few repeats
+def best_of(func, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--features", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    gdf = make_layer(args.features)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        datasets = {
+            "GPKG": (os.path.join(tmp, "bench.gpkg"), "survey"),
+            "OpenFileGDB": (os.path.join(tmp, "bench.gdb"), "survey"),
+        }
+        for driver, (path, layer) in datasets.items():
+            gdf.to_file(path, layer=layer, driver=driver)
+
+        print(f"{args.features:,} features, best of {args.repeats}\n")
+        print(f"{'driver':<12} {'engine':<8} {'read_layer (s)':>15} {'metadata (s)':>13} {'features/s':>12}")
+
+        for driver, (path, layer) in datasets.items():
+            for engine in ENGINES:
+                if engine == "arrow" and not helper_functions.HAS_ARROW:
+                    continue
+
+                read_s = best_of(
+                    lambda: helper_functions.read_layer(path, layer=layer, engine=engine), args.repeats
+                )
+                meta_s = best_of(
+                    lambda: helper_functions.read_vector_layer_metadata(path, layer=layer, engine=engine),
+                    args.repeats,
+                )
+                print(f"{driver:<12} {engine:<8} {read_s:>15.3f} {meta_s:>13.3f} {args.features / read_s:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
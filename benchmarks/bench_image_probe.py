@@ -0,0 +1,104 @@
+"""
+Benchmark: image header probes vs PIL for the image metadata.
+
+Writes a mixed corpus of field-photo-like images (JPEG and HEIC with EXIF
+and GPS, PNG, TIFF) and times extract_image_metadata with the header
+probes and with PIL only. HEIC files are included when pillow-heif is
+installed (PIL cannot read them without it).
+
+Run from the repository root:
+    python benchmarks/bench_image_probe.py --files 2000
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+from PIL.TiffImagePlugin import IFDRational
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import helper_functions  # noqa: E402
+
+try:
+    import pillow_heif
+    pillow_heif.register_heif_opener()
+    FORMATS = ["jpg", "png", "tif", "heic"]
+except ImportError:
+    FORMATS = ["jpg", "png", "tif"]
+
+
+# function to build a camera-like EXIF block with a GPS fix
+def make_exif():
+    exif = Image.Exif()
+    exif[271], exif[272] = "Canon", "EOS R5"
+    exif.get_ifd(0x8769)[36867] = "2023:05:04 10:11:12"
+    gps = exif.get_ifd(0x8825)
+    gps[1], gps[3] = "N", "E"
+    gps[2] = (IFDRational(27), IFDRational(55), IFDRational(1234, 100))
+    gps[4] = (IFDRational(35), IFDRational(10), IFDRational(5678, 100))
+    return exif
+
+
+# function to write the corpus: one encoded template per format, copied n_files times
+def make_corpus(folder, n_files, size, seed=0):
+    rng = np.random.default_rng(seed)
+    pixels = Image.fromarray(rng.integers(0, 255, (size[1], size[0], 3), dtype=np.uint8))
+
+    templates = {}
+    for extension in FORMATS:
+        templates[extension] = os.path.join(folder, f"template.{extension}")
+        if extension == "png":
+            pixels.save(templates[extension])
+        else:
+            pixels.save(templates[extension], exif=make_exif())
+
+    paths = []
+    for i in range(n_files):
+        extension = FORMATS[i % len(FORMATS)]
+        path = os.path.join(folder, f"photo_{i:05d}.{extension}")
+        shutil.copyfile(templates[extension], path)
+        paths.append(path)
+
+    return paths
+
+
+# function to time a callable over a few repeats
+def best_of(func, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=1000)
+    parser.add_argument("--width", type=int, default=4000)
+    parser.add_argument("--height", type=int, default=3000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = make_corpus(tmp, args.files, (args.width, args.height))
+        size_mb = sum(os.path.getsize(p) for p in paths) / 1024 ** 2
+
+        print(f"{args.files:,} images ({', '.join(FORMATS)}), {size_mb:,.0f} MB, best of {args.repeats}\n")
+        print(f"{'reader':<14} {'success':>8} {'seconds':>9} {'files/s':>9}")
+
+        for name, probe_headers in [("PIL only", False), ("header probes", True)]:
+            seconds, meta_df = best_of(
+                lambda: helper_functions.extract_image_metadata(paths, None, probe_headers=probe_headers),
+                args.repeats,
+            )
+            success = int((meta_df["status"] == "success").sum())
+            print(f"{name:<14} {success:>8,} {seconds:>9.3f} {len(paths) / seconds:>9,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+import os
+import re
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyproj
+import shapely
+
+from helper_functions import CRS
+
+
+# column holding the dataset path in each metadata output
+DATASET_COLUMNS = {"geodatabase": "gdb", "shapefile_path": "shapefile", "file_path": "table", "image_path": "image"}
+
+_NUMBER = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|[-+]?inf")
+
+
+# function to parse a stringified bbox / obb_bbox column value
+def parse_coordinates(value):
+    """
+    Returns the numbers of a bbox or obb_bbox cell as a flat float array.
+
+    Handles the plain "[x, y, ...]" text of the CSV outputs as well as
+    numpy reprs such as "np.float64(694895.3)".
+    """
+    if not isinstance(value, str):
+        return np.array([])
+    return np.array(_NUMBER.findall(value.replace("np.float64", "")), dtype=float)
+
+
+# function to rebuild footprints from the bbox columns of a metadata table
+def footprints_from_columns(meta_df, crs=CRS):
+    """
+    Builds one polygon per row from obb_bbox (or bbox when it is missing),
+    transformed from each row's layer CRS to crs. Used when no footprint
+    catalog was written for a metadata table.
+
+    Image tables have no bbox; their photos become points at the decoded
+    GPS position.
+    """
+    geometries = np.full(len(meta_df), None, dtype=object)
+
+    if "gps_longitude" in meta_df.columns:
+        longitude = pd.to_numeric(meta_df["gps_longitude"], errors="coerce").to_numpy(dtype=float)
+        latitude = pd.to_numeric(meta_df["gps_latitude"], errors="coerce").to_numpy(dtype=float)
+        located = np.isfinite(longitude) & np.isfinite(latitude)
+        geometries[located] = shapely.points(longitude[located], latitude[located])
+        return gpd.GeoSeries(geometries, index=meta_df.index, crs=4326).to_crs(crs)
+
+    for i, (obb_bbox, bbox) in enumerate(zip(meta_df["obb_bbox"], meta_df["bbox"])):
+        obb = parse_coordinates(obb_bbox)
+        box = parse_coordinates(bbox)
+
+        if len(obb) == 8 and np.isfinite(obb).all():
+            geometries[i] = shapely.Polygon(obb.reshape(4, 2))
+        elif len(box) == 4 and np.isfinite(box).all():
+            geometries[i] = shapely.box(*box)
+
+    footprints = gpd.GeoSeries(geometries, index=meta_df.index)
+    target_crs = pyproj.CRS.from_user_input(crs)
+
+    # the bbox columns are in the layer CRS, which differs between layers
+    for layer_crs, rows in meta_df.groupby("crs").groups.items():
+        source = footprints.loc[rows].set_crs(pyproj.CRS.from_user_input(layer_crs))
+        footprints.loc[rows] = source.to_crs(target_crs).to_numpy()
+
+    return footprints.set_crs(target_crs, allow_override=True)
+
+
+# function to parse a date column of the metadata outputs
+def _parse_times(values):
+    """Returns naive timestamps (offsets converted to UTC), NaT where missing or unparseable"""
+    times = pd.to_datetime(pd.Series(values, dtype=object), errors="coerce", format="ISO8601", utc=True)
+    return times.dt.tz_localize(None).to_numpy()
+
+
+# function to get the time span of every catalog row
+def time_bounds(meta_df):
+    """
+    Returns (start, end) datetime64 arrays: min_date/max_date of layers and
+    tables, the capture time of photos, NaT for rows without dates.
+    """
+    missing = np.full(len(meta_df), None, dtype=object)
+    start = _parse_times(meta_df.get("min_date", missing))
+    end = _parse_times(meta_df.get("max_date", missing))
+
+    if "captured_time" in meta_df.columns:
+        captured = _parse_times(meta_df["captured_time"])
+        start = np.where(np.isnat(start), captured, start)
+        end = np.where(np.isnat(end), captured, end)
+
+    return start, end
+
+
+class FootprintCatalog:
+    """
+    Spatial index over the layer footprints of the geo metadata outputs.
+
+    Footprints are read from the footprint catalogs written next to the
+    metadata CSVs (joined on layer_id) or, when a catalog is missing,
+    rebuilt from the obb_bbox / bbox columns. Queries run against a
+    shapely STRtree and return the matching metadata rows.
+
+    Photo points (image metadata with its photo point layer) are indexed
+    alongside the layers, and every row keeps its time span (see
+    time_bounds) so queries can also be limited to a time range.
+    """
+
+    def __init__(self, meta_df, crs=CRS):
+        self.crs = pyproj.CRS.from_user_input(crs)
+        meta_df = meta_df[meta_df["geometry"].notna()].reset_index(drop=True)
+        self.meta_df = meta_df.drop(columns="geometry")
+        self.geometries = meta_df["geometry"].to_numpy()
+        self.tree = shapely.STRtree(self.geometries)
+        self.start_times, self.end_times = time_bounds(self.meta_df)
+
+    def __len__(self):
+        return len(self.geometries)
+
+    @classmethod
+    def from_outputs(cls, outputs, crs=CRS):
+        """
+        Loads the catalog from extraction outputs.
+
+        Parameters
+        ----------
+        outputs : list[tuple[str, str or None]]
+            (metadata CSV, footprint catalog) pairs, e.g. the geodatabase
+            and shapefile outputs or the image metadata and its photo
+            points. Missing files are skipped.
+        crs : str
+            CRS of the footprint catalogs and of query results
+        """
+        frames = []
+
+        for metadata_csv, footprint_file in outputs:
+            if not metadata_csv or not os.path.exists(metadata_csv):
+                continue
+
+            meta_df = pd.read_csv(metadata_csv)
+            if meta_df.empty or "layer_id" not in meta_df.columns:
+                continue
+            if "status" in meta_df.columns:
+                meta_df = meta_df[meta_df["status"] != "removed"].reset_index(drop=True)
+
+            dataset_column = next(c for c in DATASET_COLUMNS if c in meta_df.columns)
+            meta_df.insert(0, "source", DATASET_COLUMNS[dataset_column])
+            meta_df.insert(1, "dataset", meta_df[dataset_column])
+
+            if footprint_file and os.path.exists(footprint_file):
+                if str(footprint_file).lower().endswith(".parquet"):
+                    footprints = gpd.read_parquet(footprint_file)
+                else:
+                    footprints = gpd.read_file(footprint_file, layer="footprints")
+                footprints = footprints.to_crs(crs).set_index("layer_id").geometry
+                meta_df["geometry"] = meta_df["layer_id"].map(footprints).to_numpy()
+            else:
+                meta_df["geometry"] = footprints_from_columns(meta_df, crs).to_numpy()
+
+            frames.append(meta_df)
+
+        meta_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=["geometry"])
+        return cls(meta_df, crs=crs)
+
+    def _in_time_range(self, rows, start, end):
+        """Returns the mask of rows whose time span overlaps [start, end]"""
+        keep = np.ones(len(rows), dtype=bool)
+        if start is not None:
+            keep &= self.end_times[rows] >= np.datetime64(pd.Timestamp(start))
+        if end is not None:
+            keep &= self.start_times[rows] <= np.datetime64(pd.Timestamp(end))
+        return keep
+
+    def query(self, geometry, crs=None, predicate="intersects", start=None, end=None):
+        """
+        Returns the metadata rows whose footprint matches geometry.
+
+        Parameters
+        ----------
+        geometry : shapely geometry
+            Area of interest
+        crs : str or None
+            CRS of geometry (None when it is already in the catalog CRS)
+        predicate : str
+            STRtree predicate, e.g. 'intersects', 'contains', 'within'
+        start, end : str, datetime or None
+            Time range; when given, only rows whose time span overlaps it
+            are returned (rows without dates are left out)
+        """
+        if crs is not None:
+            geometry = gpd.GeoSeries([geometry], crs=crs).to_crs(self.crs).iloc[0]
+
+        hits = np.sort(self.tree.query(geometry, predicate=predicate))
+        hits = hits[self._in_time_range(hits, start, end)]
+        return self.meta_df.iloc[hits].reset_index(drop=True)
+
+    def query_bbox(self, minx, miny, maxx, maxy, crs=None, predicate="intersects", start=None, end=None):
+        """Returns the metadata rows whose footprint matches a bounding box"""
+        return self.query(shapely.box(minx, miny, maxx, maxy), crs=crs, predicate=predicate, start=start, end=end)
+
+    def query_time(self, start=None, end=None):
+        """Returns the metadata rows whose time span overlaps [start, end], wherever they are"""
+        rows = np.arange(len(self.geometries))
+        return self.meta_df.iloc[rows[self._in_time_range(rows, start, end)]].reset_index(drop=True)
+
+    def to_geodataframe(self):
+        """Returns the catalog rows with their footprints"""
+        return gpd.GeoDataFrame(self.meta_df, geometry=self.geometries, crs=self.crs)
@@ -0,0 +1,189 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pyproj
+import shapely
+
+
+# header words naming the x / y coordinate of a point table
+X_NAMES = {"lon", "long", "lng", "longitude", "x", "xcoord", "easting", "east"}
+Y_NAMES = {"lat", "latitude", "y", "ycoord", "northing", "north"}
+
+# share of non-empty sample values that must parse as numbers
+MIN_NUMERIC_SHARE = 0.9
+
+# share of numeric sample pairs that must lie in the area of use of the CRS
+# (placeholders such as 0,0 or typos do not hide a coordinate pair)
+MIN_IN_AREA_SHARE = 0.95
+
+
+# function to split a column name into lower case words
+def _name_words(name):
+    return re.findall(r"[a-z]+", str(name).lower())
+
+
+# function to parse a coordinate column, or None when it is not numeric enough
+def _numeric_values(series):
+    present = series.dropna()
+    if present.empty:
+        return None
+
+    values = pd.to_numeric(present, errors="coerce").dropna()
+    if len(values) < MIN_NUMERIC_SHARE * len(present):
+        return None
+    return values
+
+
+# function to get the area of use of a CRS in degrees and in its own units
+def crs_area_bounds(crs):
+    """
+    Returns (degree bounds, projected bounds) of the area of use of crs as
+    (minx, miny, maxx, maxy). Without an area of use the degree bounds are
+    the whole globe and the projected bounds None.
+    """
+    crs = pyproj.CRS.from_user_input(crs)
+    area = crs.area_of_use
+    if area is None:
+        return (-180, -90, 180, 90), None
+
+    projected_bounds = pyproj.Transformer.from_crs(4326, crs, always_xy=True).transform_bounds(*area.bounds)
+    return area.bounds, projected_bounds
+
+
+# function to flag the coordinate pairs inside bounds
+def _in_bounds(x, y, bounds):
+    minx, miny, maxx, maxy = bounds
+    return (x >= minx) & (x <= maxx) & (y >= miny) & (y <= maxy)
+
+
+# function to find the x/y columns of a point table
+def detect_coordinate_columns(df, crs):
+    """
+    Finds a pair of coordinate columns in a table sample.
+
+    Candidates are picked from the header (Lat/Lon, Latitude/Longitude,
+    Easting/Northing, X/Y, POINT_X...; pairs sharing their other words such
+    as Start_Lat/Start_Lon are tried first) and confirmed on the sample
+    values: pairs mostly (MIN_IN_AREA_SHARE) within the area of use of crs
+    in degrees are taken as EPSG:4326, pairs mostly within its projected
+    area of use as crs. Without an area of use, pairs within -180..180 /
+    -90..90 are taken as EPSG:4326 and projected pairs are not detected.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        First rows of the table
+    crs : str
+        Project CRS, assumed for projected coordinates
+
+    Returns
+    -------
+    tuple[str, str, str] or None
+        (x column, y column, CRS of the coordinates)
+    """
+    x_columns = [c for c in df.columns if X_NAMES & set(_name_words(c))]
+    y_columns = [c for c in df.columns if Y_NAMES & set(_name_words(c))]
+
+    def other_words(column, names):
+        return [w for w in _name_words(column) if w not in names]
+
+    pairs = sorted(
+        ((x, y) for x in x_columns for y in y_columns if x != y),
+        key=lambda pair: other_words(pair[0], X_NAMES) != other_words(pair[1], Y_NAMES),
+    )
+
+    project_crs = pyproj.CRS.from_user_input(crs)
+    degree_bounds, projected_bounds = crs_area_bounds(project_crs)
+
+    for x_column, y_column in pairs:
+        x, y = _numeric_values(df[x_column]), _numeric_values(df[y_column])
+        if x is None or y is None:
+            continue
+
+        x, y = x.align(y, join="inner")
+        if x.empty:
+            continue
+
+        if _in_bounds(x, y, degree_bounds).mean() >= MIN_IN_AREA_SHARE:
+            return x_column, y_column, "EPSG:4326"
+
+        if projected_bounds is not None and _in_bounds(x, y, projected_bounds).mean() >= MIN_IN_AREA_SHARE:
+            return x_column, y_column, project_crs.to_string()
+
+    return None
+
+
+class PointExtent:
+    """
+    Running point count, bounding box and convex hull of a point table,
+    updated chunk by chunk in the project CRS. Points outside the area of
+    use of their CRS (placeholders such as 0,0, swapped or mistyped
+    values) are left out of the extent and counted in out_of_area_count.
+    """
+
+    def __init__(self, x_column, y_column, source_crs, crs):
+        self.x_column = x_column
+        self.y_column = y_column
+        self.crs = pyproj.CRS.from_user_input(crs)
+
+        source_crs = pyproj.CRS.from_user_input(source_crs)
+        degree_bounds, projected_bounds = crs_area_bounds(self.crs)
+        self.area_bounds = degree_bounds if source_crs.is_geographic else projected_bounds
+        self.transformer = None
+        if not source_crs.equals(self.crs):
+            self.transformer = pyproj.Transformer.from_crs(source_crs, self.crs, always_xy=True)
+
+        self.point_count = 0
+        self.out_of_area_count = 0
+        self.bounds = np.array([np.inf, np.inf, -np.inf, -np.inf])
+        self.hull = None
+
+    def update(self, df):
+        x = pd.to_numeric(df[self.x_column], errors="coerce").to_numpy(dtype=float)
+        y = pd.to_numeric(df[self.y_column], errors="coerce").to_numpy(dtype=float)
+
+        valid = np.isfinite(x) & np.isfinite(y)
+        if self.area_bounds is not None:
+            in_area = _in_bounds(x, y, self.area_bounds)
+            self.out_of_area_count += int(np.count_nonzero(valid & ~in_area))
+            valid &= in_area
+
+        x, y = x[valid], y[valid]
+        if len(x) == 0:
+            return
+
+        if self.transformer is not None:
+            x, y = self.transformer.transform(x, y)
+
+        self.point_count += len(x)
+        self.bounds = np.concatenate([
+            np.fmin(self.bounds[:2], [x.min(), y.min()]),
+            np.fmax(self.bounds[2:], [x.max(), y.max()]),
+        ])
+
+        points = shapely.multipoints(np.column_stack([x, y]))
+        parts = [points] if self.hull is None else [points, self.hull]
+        self.hull = shapely.convex_hull(shapely.geometrycollections(parts))
+
+    def to_meta(self):
+        """Returns the spatial metadata columns shared with the vector layers"""
+        if self.point_count == 0:
+            return {}
+
+        obb = self.hull.minimum_rotated_rectangle
+        obb_coords = (
+            list(obb.exterior.coords)[:4] if obb.geom_type == "Polygon" else list(obb.coords)
+        )
+
+        return {
+            "crs": str(self.crs),
+            "epsg": self.crs.to_epsg(),
+            "geometry_types": "Point",
+            "bbox": self.bounds.tolist(),
+            "obb_bbox": obb_coords,
+            "feature_count": self.point_count,
+            "out_of_area_count": self.out_of_area_count,
+            "has_geometry": True,
+            "footprint_wkb": obb.wkb_hex,
+        }
@@ -0,0 +1,230 @@
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
+import openpyxl
+import xlrd
+
+
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+DOC_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_CELL_REF = re.compile(r"([A-Z]+)(\d+)")
+
+
+# function to split a cell reference such as "AB12" into (row, column) numbers
+def split_cell_ref(ref):
+    """Returns 1-based (row, column) of an A1-style cell reference"""
+    letters, digits = _CELL_REF.fullmatch(ref.replace("$", "")).groups()
+
+    column = 0
+    for letter in letters:
+        column = column * 26 + ord(letter) - ord("A") + 1
+
+    return int(digits), column
+
+
+# function to list the sheet names and their xml parts of a workbook
+def _workbook_sheets(zf):
+    """Returns [(sheet name, sheet xml part), ...] in workbook order"""
+    rels = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+    targets = {
+        rel.get("Id"): rel.get("Target")
+        for rel in rels.iter(f"{PKG_REL_NS}Relationship")
+    }
+
+    sheets = []
+    workbook = ET.fromstring(zf.read("xl/workbook.xml"))
+    for sheet in workbook.iter(f"{MAIN_NS}sheet"):
+        target = targets[sheet.get(f"{DOC_REL_NS}id")]
+        if target.startswith("/"):
+            part = target.lstrip("/")
+        else:
+            part = posixpath.normpath(posixpath.join("xl", target))
+        sheets.append((sheet.get("name"), part))
+
+    return sheets
+
+
+# function to read the dimension record and first row of a worksheet
+def _sheet_dimension_and_header(zf, part):
+    """
+    Streams a worksheet until its first row and returns (dimension ref,
+    header row number, [(column, type, value), ...]). Nothing after the
+    header row is read.
+    """
+    dimension, header_row, cells = None, None, []
+
+    with zf.open(part) as f:
+        for _, elem in ET.iterparse(f, events=("end",)):
+            if elem.tag == f"{MAIN_NS}dimension":
+                dimension = elem.get("ref")
+
+            elif elem.tag == f"{MAIN_NS}row":
+                header_row = int(elem.get("r")) if elem.get("r") else 1
+                for position, cell in enumerate(elem.iter(f"{MAIN_NS}c"), start=1):
+                    column = split_cell_ref(cell.get("r"))[1] if cell.get("r") else position
+                    if cell.get("t") == "inlineStr":
+                        value = "".join(t.text or "" for t in cell.iter(f"{MAIN_NS}t"))
+                    else:
+                        value = cell.findtext(f"{MAIN_NS}v")
+                    cells.append((column, cell.get("t"), value))
+                break
+
+    return dimension, header_row, cells
+
+
+# function to look up a few entries of the shared strings table
+def _shared_strings(zf, indices):
+    """Returns {index: text} for the wanted indices, stopping after the last one"""
+    if not indices or "xl/sharedStrings.xml" not in zf.namelist():
+        return {}
+
+    wanted, last, strings = set(indices), max(indices), {}
+
+    with zf.open("xl/sharedStrings.xml") as f:
+        index = 0
+        for _, elem in ET.iterparse(f, events=("end",)):
+            if elem.tag != f"{MAIN_NS}si":
+                continue
+            if index in wanted:
+                strings[index] = "".join(t.text or "" for t in elem.iter(f"{MAIN_NS}t"))
+            if index >= last:
+                break
+            elem.clear()
+            index += 1
+
+    return strings
+
+
+# function to name the columns of a header row like pandas does
+def _column_names(values, first_column, last_column):
+    # pandas numbers unnamed columns by their position from column A
+    return [
+        f"Unnamed: {column - 1}" if values.get(column) in (None, "") else str(values[column])
+        for column in range(first_column, last_column + 1)
+    ]
+
+
+# function to count a worksheet by streaming it with openpyxl
+def _probe_sheet_streaming(path, sheet_name):
+    """Fallback for worksheets without a usable dimension record"""
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name]
+        ws.reset_dimensions()
+
+        header, header_row, row_count, column_count = None, 1, 0, 0
+        for row_number, row in enumerate(ws.iter_rows(values_only=True), start=1):
+            if header is None:
+                if all(value is None for value in row):
+                    continue
+                header, header_row = row, row_number
+            else:
+                row_count += 1
+            column_count = max(column_count, len(row))
+    finally:
+        wb.close()
+
+    values = dict(enumerate(header or (), start=1))
+    return header_row, row_count, column_count, _column_names(values, 1, column_count)
+
+
+# function to read the sheet sizes and headers of an xlsx workbook
+def probe_xlsx(path):
+    """
+    Reads sheet names, row/column counts and header rows of an .xlsx file
+    from the workbook structure, without loading cell data.
+
+    Each worksheet is streamed only up to its first row: the size comes
+    from its <dimension> record and header strings are looked up in the
+    shared strings table. Sheets without a usable dimension record are
+    counted with openpyxl in read-only (streaming) mode.
+    """
+    sheets = []
+
+    with zipfile.ZipFile(path) as zf:
+        probed = [
+            (name, *_sheet_dimension_and_header(zf, part))
+            for name, part in _workbook_sheets(zf)
+        ]
+        shared = _shared_strings(zf, [
+            int(value) for *_, cells in probed
+            for _, cell_type, value in cells if cell_type == "s" and value is not None
+        ])
+
+    for name, dimension, header_row, cells in probed:
+        values = {
+            column: shared.get(int(value)) if cell_type == "s" and value is not None else value
+            for column, cell_type, value in cells
+        }
+
+        bounds = dimension.split(":") if dimension else []
+        usable = len(bounds) == 2 or (len(bounds) == 1 and len(cells) <= 1)
+
+        first_column = 1
+        if header_row is None:
+            header_row, row_count, column_count, column_names = 1, 0, 0, []
+        elif usable:
+            (_, first_column), (last_row, last_column) = split_cell_ref(bounds[0]), split_cell_ref(bounds[-1])
+            last_column = max([last_column] + list(values))
+            row_count = max(last_row - header_row, 0)
+            column_count = last_column - first_column + 1
+            column_names = _column_names(values, first_column, last_column)
+        else:
+            header_row, row_count, column_count, column_names = _probe_sheet_streaming(path, name)
+
+        sheets.append({
+            "sheet_name": name,
+            "header_row": header_row,
+            "first_column": first_column,
+            "last_column": first_column + column_count - 1,
+            "row_count": row_count,
+            "column_count": column_count,
+            "column_names": column_names,
+        })
+
+    return sheets
+
+
+# function to read the sheet sizes and headers of a legacy xls workbook
+def probe_xls(path):
+    """
+    Reads sheet names, row/column counts and header rows of an .xls file.
+    Sheets are loaded one at a time (xlrd on_demand) and released again.
+    """
+    sheets = []
+    book = xlrd.open_workbook(path, on_demand=True)
+    try:
+        for index, name in enumerate(book.sheet_names()):
+            sheet = book.sheet_by_index(index)
+            header = sheet.row_values(0) if sheet.nrows else []
+
+            sheets.append({
+                "sheet_name": name,
+                "header_row": 1,
+                "first_column": 1,
+                "last_column": sheet.ncols,
+                "row_count": max(sheet.nrows - 1, 0),
+                "column_count": sheet.ncols,
+                "column_names": _column_names(dict(enumerate(header, start=1)), 1, sheet.ncols),
+            })
+            book.unload_sheet(index)
+    finally:
+        book.release_resources()
+
+    return sheets
+
+
+# function to probe any supported workbook
+def probe_excel(path):
+    """
+    Returns one dict per sheet: sheet_name, header_row, first_column and
+    last_column (1-based, the used range), row_count (rows below the
+    header), column_count and column_names.
+    """
+    if path.lower().endswith(".xls"):
+        return probe_xls(path)
+    return probe_xlsx(path)
@@ -1,7 +1,11 @@
 import geopandas as gpd
 import pandas as pd
+import numpy as np
 import fiona 
 from fiona.errors import DriverError
+import pyogrio
+import pyproj
+from pyogrio.errors import DataSourceError
 import os
 from tqdm import tqdm
 import matplotlib.pyplot as plt
@@ -10,9 +14,23 @@ import shapely
 from shapely.geometry import shape
 from shapely.errors import GeometryTypeError
 from datetime import datetime
+from itertools import islice
+from collections import deque
 from PIL import Image, ExifTags
 import logging
+import hashlib
+import inspect
+import io
+import json
+import multiprocessing
 import warnings
+import time
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from inventory_cache import InventoryCache
+from excel_probe import probe_excel
+from sketches import TableProfile, merge_dtypes
+from coordinate_columns import PointExtent, detect_coordinate_columns
+from image_probe import decode_gps_info, probe_image
 
 
 # ---------------------------
@@ -56,106 +74,377 @@ def get_files_to_list(root_dirs, files_endwith):
 
     return db_paths
 
-# 
-def extract_image_metadata(
-    image_paths,
-    output_csv
-):
+# Arrow (columnar) reads are used when pyarrow is installed
+try:
+    import pyarrow
+    import pyarrow.csv as pacsv
+    HAS_ARROW = True
+except ImportError:
+    HAS_ARROW = False
+
+# bytes parsed per batch by the Arrow CSV reader (its threads split each batch)
+ARROW_CSV_BLOCK_SIZE = 16 * 1024 ** 2
+
+# dtype pandas gives text columns ('str' with pandas 3, object before)
+PANDAS_STRING_DTYPE = pd.Series([""]).dtype
+
+# (path, layer) pairs whose driver failed an Arrow read; read row by row instead
+_ARROW_FALLBACK_LAYERS = set()
+
+# EPSG code of every distinct CRS seen in this run, keyed by WKT
+_CRS_EPSG_CACHE = {}
+
+# (layer metadata, derived metadata) of the first layer seen with each fingerprint
+_FINGERPRINT_METADATA = {}
+
+# file buckets filled by the single-pass crawler (add new document types here)
+FILE_BUCKETS = {
+    "shapefile": SHAPEFILES_EXTENSIONS,
+    "table": CSV_EXCEL_EXTENSIONS,
+    "image": IMAGES_EXTENSTIONS,
+}
+GDB_SUFFIX = "gdb"
+
+# function to classify one directory entry into an inventory bucket
+def classify_entry(name, is_dir):
+    """Returns the inventory bucket for a file or folder name, or None"""
+    if is_dir:
+        return "gdb" if name.endswith(GDB_SUFFIX) else None
+
+    for bucket, extensions in FILE_BUCKETS.items():
+        if any(name.endswith(ext) for ext in extensions):
+            return bucket
+    return None
+
+# function to list and classify a single directory
+def _scan_directory(dirpath):
     """
-    Extracts metadata from image files using file system info,
-    PIL image headers, EXIF (if present), and path-based inference.
+    Lists one directory with os.scandir and classifies its entries.
+
+    Returns (classified, subdirs) where classified is a list of
+    (bucket, path) tuples and subdirs the folders still to walk.
+    Entries are sorted by name so the walk order is stable.
+    """
+    classified = []
+    subdirs = []
+
+    try:
+        with os.scandir(dirpath) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError as e:
+        logging.warning(f"Cannot list {dirpath}: {e}")
+        return classified, subdirs
+
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            continue
+
+        bucket = classify_entry(entry.name, is_dir)
+        if bucket is not None:
+            classified.append((bucket, entry.path))
+
+        # geodatabases are read by GDAL, never walked into
+        if is_dir and bucket != "gdb" and not entry.is_symlink():
+            subdirs.append(entry.path)
+
+    return classified, subdirs
+
+# function to list a whole tree concurrently (for high latency network shares)
+def _scan_tree_parallel(root_dir, workers):
+    """
+    Lists every directory under root_dir with a bounded thread pool.
+
+    Idle threads pick the next pending directory from the shared
+    queue, so a deep branch never holds up the rest of the tree.
+    Returns {dirpath: (classified, subdirs)} for every listed folder.
+    """
+    listings = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_scan_directory, root_dir): root_dir}
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                dirpath = pending.pop(future)
+                classified, subdirs = future.result()
+                listings[dirpath] = (classified, subdirs)
+
+                for subdir in subdirs:
+                    pending[pool.submit(_scan_directory, subdir)] = subdir
+
+    return listings
+
+# function to walk the roots once and bucket every document
+def crawl_inventory(root_dirs, workers=1):
+    """
+    Walks each root directory once and sorts every entry into
+    document buckets, so all extractors share one crawl.
 
     Parameters
     ----------
-    image_paths : list[str]
-        List of full paths to image files
-    output_csv : str
-        Path to save metadata CSV
+    root_dirs : list[str]
+        Folders to scan
+    workers : int
+        Number of threads listing directories concurrently. 1 walks
+        serially; both modes return the same paths in the same order.
 
     Returns
     -------
-    pd.DataFrame
-        Image metadata table
+    dict[str, list[str]]
+        Paths per bucket: 'gdb', 'shapefile', 'table', 'image'
     """
+    inventory = {"gdb": [], **{bucket: [] for bucket in FILE_BUCKETS}}
+    dir_count = 0
+    start = time.perf_counter()
 
-    records = []
-
-    # Reverse EXIF tag map once
-    EXIF_TAGS = {v: k for k, v in ExifTags.TAGS.items()}
+    for root_dir in root_dirs:
+        if workers > 1:
+            scan = _scan_tree_parallel(root_dir, workers).__getitem__
+        else:
+            scan = _scan_directory
+
+        # replay the listings depth first, keeping the sorted order of sub folders
+        stack = [root_dir]
+        while stack:
+            dirpath = stack.pop()
+            classified, subdirs = scan(dirpath)
+            dir_count += 1
+
+            for bucket, path in classified:
+                inventory[bucket].append(path)
+
+            stack.extend(reversed(subdirs))
+
+    elapsed = time.perf_counter() - start
+    rate = dir_count / elapsed if elapsed > 0 else float("inf")
+    print(f"Crawled {dir_count} directories in {elapsed:.1f}s ({rate:.0f} dirs/sec)")
+
+    return inventory
+
+# function to read the header and EXIF of an image with PIL
+def read_image_header_pil(img_path):
+    """Returns the same fields as image_probe.probe_image, for any format PIL can open"""
+    with Image.open(img_path) as img:
+        exif_data = img.getexif()
+        tags = {**exif_data, **exif_data.get_ifd(ExifTags.IFD.Exif)}
+        exif = {
+            ExifTags.TAGS[tag]: value for tag, value in tags.items()
+            if tag in ExifTags.TAGS and tag not in (ExifTags.IFD.Exif, ExifTags.IFD.GPSInfo)
+        }
+        gps = exif_data.get_ifd(ExifTags.IFD.GPSInfo)
+        if gps:
+            exif["GPSInfo"] = dict(gps)
+
+        return {
+            "image_format": img.format,
+            "color_mode": img.mode,
+            "width_px": img.size[0],
+            "height_px": img.size[1],
+            "exif": exif or None,
+        }
 
-    for img_path in tqdm(image_paths):
+# function to map over items with a pool, keeping order and a bounded number of pending tasks
+def iter_bounded_map(pool, func, items, max_in_flight):
+    """
+    Yields func(item) in the order of items while at most max_in_flight
+    tasks are submitted and not yet collected, so a long (or lazily
+    generated) list never queues every task at once.
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= max_in_flight:
+            yield pending.popleft().result()
+        pending.append(pool.submit(func, item))
+
+    while pending:
+        yield pending.popleft().result()
+
+# function to extract one image's metadata row
+def extract_image_row(img_path, probe_headers=True):
+    """Returns the metadata of one image; failures are recorded in status/error"""
+    file_name = os.path.basename(img_path)
+    name_no_ext, ext = os.path.splitext(file_name)
+
+    meta = {
+        "image_path": img_path,
+        "layer_id": make_layer_id(img_path),
+        "file_name": file_name,
+        "file_extension": ext.lower(),
+        "status": "success",
+        "error": None
+    }
+
+    try:
+        # ---- File system metadata ----
+        stat = os.stat(img_path)
+
+        meta["file_size_mb"] = round(stat.st_size / (1024 ** 2), 3)
+        meta["created_time"] = datetime.fromtimestamp(stat.st_ctime)
+        meta["modified_time"] = datetime.fromtimestamp(stat.st_mtime)
+
+        # ---- Path-based metadata ----
+        path_parts = img_path.split(os.sep)
+        path_parts_lower = [p.lower() for p in path_parts]
+
+        meta["Species"] = find_match(SPECIES_TYPES, path_parts_lower)
+        meta["activity"] = find_match(ACTIVITY_TYPES, path_parts_lower)
+
+        # ---- Filename-derived metadata ----
+        tokens = name_no_ext.replace("-", "_").split("_")
+        meta["filename_tokens"] = ", ".join(tokens)
+
+        # ---- Image header metadata ----
+        header = None
+        if probe_headers:
+            try:
+                header = probe_image(img_path)
+            except ValueError as e:
+                logging.warning(f"Header probe failed for {img_path}, using PIL: {e}")
+        meta["header_reader"] = "probe" if header else "pil"
+        if header is None:
+            header = read_image_header_pil(img_path)
+
+        meta["image_format"] = header["image_format"]
+        meta["color_mode"] = header["color_mode"]
+        meta["width_px"], meta["height_px"] = header["width_px"], header["height_px"]
+        meta["aspect_ratio"] = round(header["width_px"] / header["height_px"], 4)
+
+        # ---- EXIF metadata (best effort) ----
+        exif = header["exif"]
+        if exif:
+            meta["has_exif"] = True
+            meta["camera_make"] = exif.get("Make")
+            meta["camera_model"] = exif.get("Model")
+            meta["datetime_original"] = exif.get("DateTimeOriginal")
+            meta["gps_info"] = "GPSInfo" in exif
+        else:
+            exif = {}
+            meta["has_exif"] = False
+            meta["camera_make"] = None
+            meta["camera_model"] = None
+            meta["datetime_original"] = None
+            meta["gps_info"] = False
+
+        # ---- GPS position and capture time ----
+        meta.update(decode_gps_info(exif.get("GPSInfo")))
+
+        # camera clock (local time) first, the UTC GPS fix time otherwise
+        captured = pd.to_datetime(str(exif.get("DateTimeOriginal")).strip(), format="%Y:%m:%d %H:%M:%S", errors="coerce")
+        if pd.isna(captured):
+            captured = meta["gps_timestamp"]
+        meta["captured_time"] = None if pd.isna(captured) else captured
+
+    except PermissionError as e:
+        meta["status"] = "skipped"
+        meta["error"] = str(e)
+
+    except Exception as e:
+        meta["status"] = "failed"
+        meta["error"] = str(e)
+
+    return meta
+
+# function to place the geotagged photos in the project CRS
+def add_photo_points(meta_df, crs=CRS):
+    """
+    Adds x/y, crs and epsg in the project CRS and a point footprint_wkb to
+    every photo with a GPS fix (EXIF positions are WGS84), so the photos
+    can be written as a point layer with write_footprints.
+    """
+    if meta_df.empty or "gps_longitude" not in meta_df.columns:
+        return meta_df
 
-        file_name = os.path.basename(img_path)
-        name_no_ext, ext = os.path.splitext(file_name)
+    longitude = pd.to_numeric(meta_df["gps_longitude"], errors="coerce").to_numpy(dtype=float)
+    latitude = pd.to_numeric(meta_df["gps_latitude"], errors="coerce").to_numpy(dtype=float)
+    located = np.isfinite(longitude) & np.isfinite(latitude)
 
-        meta = {
-            "image_path": img_path,
-            "file_name": file_name,
-            "file_extension": ext.lower(),
-            "status": "success",
-            "error": None
-        }
+    target_crs = pyproj.CRS.from_user_input(crs)
+    transformer = pyproj.Transformer.from_crs(4326, target_crs, always_xy=True)
 
-        try:
-            # ---- File system metadata ----
-            stat = os.stat(img_path)
+    x, y = np.full(len(meta_df), np.nan), np.full(len(meta_df), np.nan)
+    x[located], y[located] = transformer.transform(longitude[located], latitude[located])
 
-            meta["file_size_mb"] = round(stat.st_size / (1024 ** 2), 3)
-            meta["created_time"] = datetime.fromtimestamp(stat.st_ctime)
-            meta["modified_time"] = datetime.fromtimestamp(stat.st_mtime)
+    footprint_wkb = np.full(len(meta_df), None, dtype=object)
+    footprint_wkb[located] = shapely.to_wkb(shapely.points(x[located], y[located]), hex=True)
 
-            # ---- Path-based metadata ----
-            path_parts = img_path.split(os.sep)
-            path_parts_lower = [p.lower() for p in path_parts]
+    meta_df["x"], meta_df["y"] = x, y
+    meta_df["crs"] = np.where(located, str(target_crs), None)
+    meta_df["epsg"] = pd.Series(resolve_epsg(target_crs), index=meta_df.index, dtype="Int64").where(located)
+    meta_df["footprint_wkb"] = footprint_wkb
 
-            meta["Species"] = find_match(SPECIES_TYPES, path_parts_lower)
-            meta["activity"] = find_match(ACTIVITY_TYPES, path_parts_lower)
+    return meta_df
 
-            # ---- Filename-derived metadata ----
-            tokens = name_no_ext.replace("-", "_").split("_")
-            meta["filename_tokens"] = ", ".join(tokens)
+# function to extract image metadata
+def extract_image_metadata(
+    image_paths,
+    output_csv,
+    probe_headers=True,
+    workers=1,
+    max_in_flight=None,
+    crs=CRS,
+    footprint_output=None
+):
+    """
+    Extracts metadata from image files using file system info,
+    image headers, EXIF (if present), and path-based inference.
 
-            # ---- Image header metadata ----
-            with Image.open(img_path) as img:
-                meta["image_format"] = img.format
-                meta["color_mode"] = img.mode
-                meta["width_px"], meta["height_px"] = img.size
-                meta["aspect_ratio"] = round(img.size[0] / img.size[1], 4)
-
-                # ---- EXIF metadata (best effort) ----
-                exif_data = img._getexif()
-                if exif_data:
-                    exif = {
-                        ExifTags.TAGS.get(tag, tag): value
-                        for tag, value in exif_data.items()
-                        if tag in ExifTags.TAGS
-                    }
+    JPEG, PNG, TIFF, CR2 and HEIF/HEIC headers are parsed directly
+    (image_probe), reading only the header records and EXIF fields in use.
+    Other formats, and headers the probe cannot parse, are opened with PIL.
 
-                    meta["has_exif"] = True
-                    meta["camera_make"] = exif.get("Make")
-                    meta["camera_model"] = exif.get("Model")
-                    meta["datetime_original"] = exif.get("DateTimeOriginal")
-                    meta["gps_info"] = "GPSInfo" in exif
-                else:
-                    meta["has_exif"] = False
-                    meta["camera_make"] = None
-                    meta["camera_model"] = None
-                    meta["datetime_original"] = None
-                    meta["gps_info"] = False
+    Parameters
+    ----------
+    image_paths : list[str]
+        List of full paths to image files
+    output_csv : str or None
+        Path to save metadata CSV (None to only return the table)
+    probe_headers : bool
+        Parse headers directly (False opens every image with PIL)
+    workers : int
+        Threads reading images. Extraction is dominated by os.stat and
+        header reads, so threads overlap the I/O latency (e.g. 16-32 on
+        network shares); rows keep the order of image_paths.
+    max_in_flight : int or None
+        Images submitted but not yet collected (default 4 per thread),
+        bounding memory on very long path lists
+    crs : str
+        Project CRS of the x/y columns and the photo points
+    footprint_output : str or None
+        GeoPackage (.gpkg) or GeoParquet (.parquet) receiving one point per
+        geotagged photo, linked to the CSV rows by layer_id
 
-        except Exception as e:
-            meta["status"] = "failed"
-            meta["error"] = str(e)
+    Returns
+    -------
+    pd.DataFrame
+        Image metadata table; EXIF GPS fixes are decoded into gps_latitude,
+        gps_longitude, gps_altitude, gps_timestamp and x/y in crs, and
+        captured_time holds the capture time used for time range queries
+    """
 
-        records.append(meta)
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            rows = iter_bounded_map(
+                pool, lambda img_path: extract_image_row(img_path, probe_headers),
+                image_paths, max_in_flight or 4 * workers
+            )
+            records = list(tqdm(rows, total=len(image_paths)))
+    else:
+        records = [extract_image_row(img_path, probe_headers) for img_path in tqdm(image_paths)]
 
     # ---- Create DataFrame ----
-    meta_df = pd.DataFrame(records)
+    meta_df = add_photo_points(pd.DataFrame(records), crs)
+
+    # ---- Save CSV and photo points ----
+    if output_csv:
+        write_metadata_csv(meta_df, output_csv)
 
-    # ---- Save CSV ----
-    meta_df.to_csv(output_csv, index=False, encoding="utf-8")
+    if footprint_output:
+        write_footprints(meta_df, footprint_output, crs=crs)
 
-    # return meta_df
+    return meta_df
 
 # functions to return geodatabase / files paths in list 
 def get_geodbs_to_list(root_dirs, files_endwith='gdb'):
@@ -178,195 +467,902 @@ def get_geodbs_to_list(root_dirs, files_endwith='gdb'):
 
     return db_names, db_paths
 
+# function to list the layers of one geodatabase
+def list_gdb_layers(gdb_path):
+    """Returns the layer names of a geodatabase ([] when it cannot be opened)"""
+    try:
+        return list(pyogrio.list_layers(gdb_path)[:, 0])
+
+    except Exception as e:
+        print(f"Skipping {gdb_path}: {e}")
+        return []  # keep record of failed GDBs
+
+# stream layers of many geodatabases
+def iter_gdb_layers(gdb_paths, workers=8):
+    """
+    Lists the layers of many geodatabases concurrently and yields
+    {'geodatabase', 'layer'} rows as soon as each geodatabase is listed,
+    so extraction can start while enumeration is still running.
+
+    Rows come out in gdb_paths order, grouped by geodatabase. A
+    geodatabase that cannot be opened yields one row with layer None.
+    """
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        for gdb_path, layers in zip(gdb_paths, pool.map(list_gdb_layers, gdb_paths)):
+            if layers:
+                for layer in layers:
+                    yield {
+                        "geodatabase": gdb_path,
+                        "layer": layer
+                    }
+            else:
+                yield {
+                    "geodatabase": gdb_path,
+                    "layer": None
+                }
+
 # find layers in gdb
-def get_gdb_layers(gdb_paths):
+def get_gdb_layers(gdb_paths, workers=8):
+    """
+    Returns a list of {'geodatabase', 'layer'} rows for every layer
+    of every geodatabase (see iter_gdb_layers).
+    """
+    return list(iter_gdb_layers(gdb_paths, workers=workers))
+
+# function to build the id linking a layer's metadata row and footprint
+def make_layer_id(path, layer=None):
+    """Returns a short stable id for a (dataset path, layer) pair"""
+    key = f"{os.path.normpath(path)}|{'' if pd.isna(layer) else layer}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+# function to save a metadata table as CSV
+def write_metadata_csv(meta_df, output_csv):
+    """Writes the scalar metadata columns to CSV (footprints and column profiles go to their own outputs)"""
+    meta_df.drop(columns=["footprint_wkb", "column_profile"], errors="ignore").to_csv(
+        output_csv, index=False, encoding="utf-8"
+    )
+
+# columns identifying a profiled table in the column profiles output
+PROFILE_ID_COLUMNS = ["layer_id", "geodatabase", "layer", "shapefile_path", "file_path", "sheet_name"]
+
+# function to write the column profiles in long format
+def write_column_profiles(meta_df, profile_output):
+    """
+    Writes one row per profiled column (null count, min, max, approximate
+    distinct count...) keyed by the identifying columns of its table.
+    """
+    if "column_profile" in meta_df.columns:
+        rows = meta_df[meta_df["column_profile"].notna() & (meta_df["status"] != "removed")]
+    else:
+        rows = meta_df.iloc[0:0]
+
+    id_columns = [c for c in PROFILE_ID_COLUMNS if c in meta_df.columns]
+    records = [
+        {**ids, **column}
+        for ids, profile in zip(rows[id_columns].to_dict("records"), rows.get("column_profile", []))
+        for column in json.loads(profile)
+    ]
+
+    pd.DataFrame(
+        records,
+        columns=id_columns + ["column", "dtype", "rows_profiled", "null_count", "min", "max", "distinct_count"],
+    ).to_csv(profile_output, index=False, encoding="utf-8")
+
+# function to write the layer footprints catalog
+def write_footprints(meta_df, footprint_output, crs=CRS):
     """
-    Returns a dictionary mapping each geodatabase path
-    to a list of its layer names.
+    Writes one footprint polygon per layer, keyed by layer_id, to a
+    GeoPackage or GeoParquet (.parquet) file in the project CRS.
     """
-    layers_dict = {}
-    rows = []
+    if "footprint_wkb" in meta_df.columns:
+        rows = meta_df[meta_df["footprint_wkb"].notna() & (meta_df["status"] != "removed")]
+    else:
+        rows = meta_df.iloc[0:0].assign(layer_id=None, footprint_wkb=None)
+
+    footprints = gpd.GeoDataFrame(
+        {"layer_id": rows["layer_id"].to_numpy()},
+        geometry=gpd.GeoSeries.from_wkb(rows["footprint_wkb"].to_numpy()),
+        crs=crs,
+    )
+
+    # photo points also carry their path, capture time and altitude (cached rows hold times as text;
+    # a batch of failed images has no EXIF columns at all)
+    if "image_path" in rows.columns:
+        photos = rows.reindex(columns=["image_path", "captured_time", "gps_altitude"])
+        footprints["image_path"] = photos["image_path"].to_numpy()
+        footprints["captured_time"] = pd.to_datetime(photos["captured_time"], errors="coerce", format="ISO8601").to_numpy()
+        footprints["gps_altitude"] = pd.to_numeric(photos["gps_altitude"], errors="coerce").to_numpy()
+
+    if str(footprint_output).lower().endswith(".parquet"):
+        footprints.to_parquet(footprint_output, index=False)
+    else:
+        footprints.to_file(footprint_output, layer="footprints", driver="GPKG")
+
+# function to read a vector layer with the configured I/O engine
+def read_layer(path, layer=None, engine="auto", **kwargs):
+    """
+    Reads a vector layer with the selected engine.
 
-    for gdb_path in gdb_paths:
-        try:
-            layers = fiona.listlayers(gdb_path)
-            layers_dict[gdb_path] = list(layers)
+    Parameters
+    ----------
+    path : str
+        Geodatabase folder or vector file
+    layer : str or None
+        Layer name inside path
+    engine : str
+        'auto' (Arrow when pyarrow is installed, else 'pyogrio'),
+        'arrow' (columnar pyogrio read), 'pyogrio' or 'fiona' (row by row).
+        A layer whose driver cannot do Arrow reads falls back to 'pyogrio'.
+    **kwargs
+        Passed to gpd.read_file (columns, skip_features, max_features...)
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+    """
+    if engine == "auto":
+        engine = "arrow" if HAS_ARROW else "pyogrio"
+
+    if engine == "arrow":
+        if (path, layer) not in _ARROW_FALLBACK_LAYERS:
+            try:
+                return gpd.read_file(path, layer=layer, engine="pyogrio", use_arrow=True, **kwargs)
+            except (DataSourceError, PermissionError):
+                raise  # the layer cannot be opened at all
+            except Exception as e:
+                logging.warning(f"Arrow read failed for {path} ({layer}), using row reads: {e}")
+                _ARROW_FALLBACK_LAYERS.add((path, layer))
+        engine = "pyogrio"
+
+    if engine == "fiona":
+        # fiona pages through features with a row slice
+        skip = kwargs.pop("skip_features", 0)
+        max_features = kwargs.pop("max_features", None)
+        if skip or max_features is not None:
+            kwargs["rows"] = slice(skip, None if max_features is None else skip + max_features)
+
+    return gpd.read_file(path, layer=layer, engine=engine, **kwargs)
+
+# function to describe the fields of a layer from the driver's schema
+def layer_field_types(info):
+    """
+    Returns {field: dtype name} of a layer from pyogrio.read_info, so every
+    read mode reports the same types (a full read widens integer fields
+    holding nulls to float64). Text fields are named with pandas' string
+    dtype as reads give them, and a geometry column is listed as 'geometry'.
+    """
+    text = str(PANDAS_STRING_DTYPE)
+    field_types = {
+        name: text if ogr_type in ("OFTString", "OFTWideString") else str(dtype)
+        for name, ogr_type, dtype in zip(info["fields"], info["ogr_types"], info["dtypes"])
+    }
+    if info["geometry_type"]:
+        field_types["geometry"] = "geometry"
+    return field_types
+
+# function to get the date extremes of a layer without loading its features
+def read_layer_date_extremes(path, layer, date_cols, info, sampled_dates=None):
+    """
+    Returns a list of pd.Series holding the candidate min/max dates of date_cols.
 
+    Date/DateTime fields are aggregated by the driver with one OGR SQL
+    MIN/MAX query. Other fields (dates stored as text) are read on their
+    own, without geometry, and parsed with pd.to_datetime as a full read does.
+    With sampled_dates ({column: list of parsed pd.Series} from a layer
+    sample) text fields use the sampled values instead of a column read.
+    """
+    ogr_types = dict(zip(info["fields"], info["ogr_types"]))
+    pushed = [col for col in date_cols if ogr_types.get(col) in ("OFTDate", "OFTDateTime")]
+    other = [col for col in date_cols if col not in pushed]
+    extremes = []
+
+    if pushed:
+        aggregates = ", ".join(
+            f'MIN("{col}") AS "min_{i}", MAX("{col}") AS "max_{i}"' for i, col in enumerate(pushed)
+        )
+        try:
+            agg = pyogrio.read_dataframe(
+                path, sql=f'SELECT {aggregates} FROM "{info["layer_name"]}"',
+                sql_dialect="OGRSQL", read_geometry=False
+            )
+            for i in range(len(pushed)):
+                extremes.append(agg[[f"min_{i}", f"max_{i}"]].iloc[0].dropna())
         except Exception as e:
-            print(f"Skipping {gdb_path}: {e}")
-            layers_dict[gdb_path] = []  # keep record of failed GDBs
-            continue
+            logging.warning(f"MIN/MAX pushdown failed for {path} ({layer}), reading columns: {e}")
+            other = list(date_cols)
 
-    # return layers_dict
-    for gdb_path, layers in layers_dict.items():
-        if layers:
-            for layer in layers:
-                rows.append({
-                    "geodatabase": gdb_path,
-                    "layer": layer
-                })
-        else:
-            rows.append({
-                "geodatabase": gdb_path,
-                "layer": None
-            })
-
-        # save a csv
-    # df = pd.DataFrame(rows)
-    # df.to_csv(f"{output_layers_csv_path}", index=False)
-    
-    # return layers
-    return rows
+    if other and sampled_dates is not None:
+        for col in other:
+            extremes.extend(sampled_dates[col])
 
-# function to extract layers meta data
-def extract_gdb_layer_metadata(
-    layers_df,
-    output_csv,
-    crs=CRS
+    elif other:
+        # column-only read, no geometry
+        df = pyogrio.read_dataframe(path, layer=layer, columns=other, read_geometry=False)
+        for col in other:
+            extremes.append(pd.to_datetime(df[col], errors="coerce").dropna())
+
+    return extremes
+
+# function to resolve the EPSG code of a CRS once per run
+def resolve_epsg(crs):
+    """
+    Returns the EPSG code of a pyproj CRS (None when it has none).
+
+    pyproj's to_epsg() searches the whole EPSG database, so the result is
+    cached by WKT and each distinct CRS is only looked up once.
+    """
+    if crs is None:
+        return None
+
+    wkt = crs.to_wkt()
+    if wkt not in _CRS_EPSG_CACHE:
+        _CRS_EPSG_CACHE[wkt] = crs.to_epsg()
+    return _CRS_EPSG_CACHE[wkt]
+
+# function to read a layer in feature chunks
+def _iter_layer_chunks(path, layer, columns, feature_count, chunk_size, engine):
+    """Yields the layer as GeoDataFrames of at most chunk_size features"""
+    for offset in range(0, max(feature_count, 1), chunk_size):
+        yield read_layer(
+            path, layer=layer, engine=engine, columns=columns,
+            skip_features=offset, max_features=chunk_size
+        )
+
+# function to read an evenly strided sample of a layer
+def _iter_layer_sample(path, layer, feature_count, sample_size, engine, blocks=10, columns=None):
+    """
+    Yields about sample_size features as contiguous blocks spread evenly
+    over the layer, so the sample is not biased towards the first features.
+    """
+    blocks = max(1, min(blocks, sample_size))
+    block_size = -(-sample_size // blocks)
+    offsets = np.linspace(0, max(feature_count - block_size, 0), blocks).astype(int)
+
+    for offset in np.unique(offsets):
+        yield read_layer(
+            path, layer=layer, engine=engine, columns=columns,
+            skip_features=int(offset), max_features=block_size
+        )
+
+# type family of each OGR field type, kept when a layer is exported to another
+# driver (integer widths differ, and dates are text in shapefiles and CSVs
+# but detected as dates by GeoJSON, for example)
+OGR_TYPE_FAMILIES = {
+    "OFTInteger": "number", "OFTInteger64": "number", "OFTReal": "number",
+    "OFTString": "text", "OFTWideString": "text",
+    "OFTDate": "text", "OFTTime": "text", "OFTDateTime": "text",
+    "OFTBinary": "binary",
+}
+
+# function to fingerprint a layer from its header and a geometry sample
+def layer_fingerprint(path, layer=None, engine="auto", sample_size=1000):
+    """
+    Returns a short hash identifying the content of a vector layer.
+
+    Built from the feature count, the rounded total bounds, the field
+    names and type families (OGR_TYPE_FAMILIES, so the field types each
+    driver picks do not matter), and a hash of the normalized WKB of an
+    evenly strided sample of geometries. Coordinates are snapped to a grid
+    (1e-7 degrees or 1 cm) and single-part multi geometries unwrapped, so
+    copies of a layer exported to another format get the same fingerprint
+    as long as the feature order is kept (a FlatGeobuf spatial index, for
+    one, reorders the features).
+    """
+    info = pyogrio.read_info(path, layer=layer, force_feature_count=True, force_total_bounds=True)
+    feature_count = info["features"]
+
+    geographic = info["crs"] is not None and pyproj.CRS.from_user_input(info["crs"]).is_geographic
+    grid = 1e-7 if geographic else 0.01
+
+    wkb_hash = hashlib.sha1()
+    if feature_count > 0:
+        for gdf in _iter_layer_sample(path, layer, feature_count, min(sample_size, feature_count), engine, columns=[]):
+            geoms = gdf.geometry.values
+            single_part = shapely.get_type_id(geoms) >= 4
+            single_part &= shapely.get_num_geometries(geoms) == 1
+            geoms = np.where(single_part, shapely.get_geometry(geoms, 0), geoms)
+            geoms = shapely.normalize(shapely.set_precision(geoms, grid, mode="pointwise"))
+            for wkb in shapely.to_wkb(geoms):
+                wkb_hash.update(wkb or b"")
+
+    bounds = info.get("total_bounds")
+    key = [
+        feature_count,
+        None if bounds is None else [round(b / grid) if np.isfinite(b) else None for b in bounds],
+        [
+            f"{name}:{OGR_TYPE_FAMILIES.get(ogr_type, ogr_type)}"
+            for name, ogr_type in zip(info["fields"], info["ogr_types"])
+        ],
+        wkb_hash.hexdigest(),
+    ]
+    return hashlib.sha1(json.dumps(key).encode("utf-8")).hexdigest()[:16]
+
+# function to read a layer's metadata once per fingerprint
+def read_layer_metadata_once(path, layer, fingerprint, crs=CRS, skip_duplicates=False, **layer_options):
+    """
+    Calls read_vector_layer_metadata, or with skip_duplicates returns the
+    results of an earlier layer with the same fingerprint in this process.
+    """
+    if skip_duplicates and fingerprint in _FINGERPRINT_METADATA:
+        return _FINGERPRINT_METADATA[fingerprint]
+
+    result = read_vector_layer_metadata(path, layer=layer, crs=crs, **layer_options)
+
+    if skip_duplicates:
+        _FINGERPRINT_METADATA[fingerprint] = result
+    return result
+
+# function to point every repeated fingerprint at its first layer
+def mark_duplicates(meta_df):
+    """
+    Fills duplicate_of with the layer_id of the first layer sharing the
+    row's fingerprint (empty for first copies and removed rows).
+    """
+    if meta_df.empty or "fingerprint" not in meta_df.columns:
+        return meta_df
+
+    meta_df = meta_df.copy()
+    present = meta_df["fingerprint"].notna() & (meta_df["status"] != "removed")
+    first_ids = meta_df[present].groupby("fingerprint", sort=False)["layer_id"].transform("first")
+
+    meta_df["duplicate_of"] = None
+    duplicates = first_ids[first_ids != meta_df.loc[present, "layer_id"]]
+    meta_df.loc[duplicates.index, "duplicate_of"] = duplicates
+
+    return meta_df
+
+# function to repair only the invalid geometries of a layer
+def repair_geometries(geometry):
+    """
+    Runs a vectorized validity check and make_valid on the invalid subset only.
+
+    Parameters
+    ----------
+    geometry : gpd.GeoSeries
+        Layer geometry (missing geometries are left as they are)
+
+    Returns
+    -------
+    tuple[gpd.GeoSeries, int, int]
+        (geometry, invalid feature count, features valid after repair)
+    """
+    values = geometry.values
+    invalid = ~(shapely.is_valid(values) | shapely.is_missing(values))
+    invalid_count = int(invalid.sum())
+
+    if invalid_count == 0:
+        return geometry, 0, 0
+
+    repaired = geometry[invalid].make_valid()
+    geometry = geometry.copy()
+    geometry[invalid] = repaired
+
+    return geometry, invalid_count, int(repaired.is_valid.sum())
+
+# function to measure the vertex and part counts of a chunk of geometries
+def geometry_complexity(geoms, measured=None):
+    """
+    Vectorized complexity figures of a geometry array (no per-feature loop).
+
+    Parameters
+    ----------
+    geoms : np.ndarray
+        Shapely geometries, missing ones are ignored
+    measured : np.ndarray or None
+        The same geometries in a projected CRS for area and length
+        (None leaves them unmeasured)
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, float or None, float or None]
+        (vertex count per feature, part count per feature, total area, total length)
+    """
+    present = ~shapely.is_missing(geoms)
+    vertex_counts = shapely.get_num_coordinates(geoms[present])
+    part_counts = shapely.get_num_geometries(geoms[present])
+
+    if measured is None:
+        return vertex_counts, part_counts, None, None
+
+    measured = measured[present]
+    return (
+        vertex_counts,
+        part_counts,
+        float(shapely.area(measured).sum()),
+        float(shapely.length(measured).sum()),
+    )
+
+# function to read one vector layer and derive its metadata
+def read_vector_layer_metadata(
+    path,
+    layer=None,
+    crs=CRS,
+    mode="full",
+    empty_error=None,
+    obb_method="union",
+    chunk_size=None,
+    footprint="obb",
+    engine="auto",
+    reproject="layer",
+    sample_size=10_000,
+    profile_columns=False
 ):
     """
-    Reads geodatabase layers and extracts metadata safely.
-    
+    Reads a geodatabase layer, shapefile or geopackage and derives the
+    spatial, temporal and attribute metadata shared by the geo extractors.
+
     Parameters
     ----------
-    layers_df : pd.DataFrame
-        Must contain columns: ['geodatabase', 'layer']
-    output_csv : str
-        Path to save metadata CSV
+    path : str
+        Geodatabase folder or vector file
+    layer : str or None
+        Layer name inside path
+    crs : str
+        Projected CRS used when the layer is in EPSG:4326
+    mode : str
+        'full' reads every feature and attribute. 'fast' takes the feature
+        count, field names and field types from the driver's layer info and
+        only loads the geometry for bbox, OBB and has_z. Date ranges are
+        pushed down to the driver (see read_layer_date_extremes).
+        memory_mb is None in 'fast' mode as the attributes are never loaded.
+        'sample' reads at most sample_size features with their attributes
+        (strided blocks over the layer) for triage scans: geometry types,
+        bbox, OBB, invalid counts and memory_mb are extrapolated from the
+        sample and the row is flagged 'estimated'. Feature count, fields and
+        Date/DateTime field ranges come from the driver as in 'fast' mode
+        and are exact; dates stored as text are parsed from the sample.
+    empty_error : str or None
+        Raise ValueError with this message when the layer has no features
+    obb_method : str
+        'union' dissolves all features before the oriented bounding box.
+        'hull' keeps a running convex hull instead; the minimum rotated
+        rectangle only depends on the hull, so the OBB is the same.
+    chunk_size : int or None
+        'fast' mode only: read the geometry this many features at a time.
+        With obb_method='hull' memory is then bounded by the chunk size.
+    footprint : str
+        'obb' or 'hull': the single polygon returned as derived
+        'footprint_wkb' (hex WKB in the project CRS) for the footprint catalog.
+    engine : str
+        I/O engine, see read_layer ('auto' prefers Arrow reads)
+    reproject : str
+        How EPSG:4326 layers are brought into crs. 'layer' transforms every
+        feature before deriving bbox and OBB. 'footprint' works in the layer
+        CRS and only transforms the convex hull; bbox and OBB are then taken
+        from the projected hull, so bbox is approximate at the hull edges.
+        total_area and total_length are measured in crs units for layers in
+        a geographic CRS, and left empty with 'footprint'.
+    sample_size : int
+        'sample' mode only: per-layer budget of features to read
+    profile_columns : bool
+        Profile the attribute columns chunk by chunk (null count, min, max,
+        approximate distinct count) into derived 'column_profile'. Not
+        available in 'fast' mode, which never loads attributes.
 
-    
     Returns
     -------
-    pd.DataFrame
-        Detailed metadata table
+    tuple[dict, dict]
+        (layer metadata, derived metadata: memory_mb, has_z, estimated,
+        column_profile, footprint_wkb)
     """
+    if mode not in ("full", "fast", "sample"):
+        raise ValueError(f"Unknown metadata mode: {mode}")
 
-    records = []
+    if obb_method not in ("union", "hull"):
+        raise ValueError(f"Unknown OBB method: {obb_method}")
 
-    # for idx, row in layers_df.iterrows():
-    for idx, row in tqdm(layers_df.iterrows(), total=len(layers_df), desc="Processing layers"):
-        gdb = row["geodatabase"]
-        layer = row["layer"]
+    if footprint not in ("obb", "hull"):
+        raise ValueError(f"Unknown footprint: {footprint}")
 
-        meta = {
-            "geodatabase": gdb,
-            "layer": layer,
-            "status": "success",
-            "error": None
-        }
-   
+    if reproject not in ("layer", "footprint"):
+        raise ValueError(f"Unknown reprojection: {reproject}")
 
-        try:
-            # ---- Read layer ----
-            gdf = gpd.read_file(gdb, layer=layer)
+    # ---- Read layer ----
+    if mode in ("fast", "sample"):
+        info = pyogrio.read_info(path, layer=layer, force_feature_count=True)
+        feature_count = info["features"]
 
-            # # update to oriental bbox
-            if gdf.crs is None:
-                raise ValueError("Layer has no CRS defined")
+        if empty_error and feature_count == 0:
+            raise ValueError(empty_error)
 
-            # Reproject if geographic (degrees)
-            epsg = gdf.crs.to_epsg()
-            if epsg == 4326:
-                gdf = gdf.to_crs(crs)  # choose correct UTM zone
+        if info["crs"] is None:
+            raise ValueError("Layer has no CRS defined")
 
-            # Clean invalid geometries 
-            gdf["geometry"] = gdf.geometry.make_valid()
+        field_types = layer_field_types(info)
+        existing_date_cols = [col for col in DATE_COLUMNS if col in field_types]
 
-            # Dissolve all features
-            geom = gdf.geometry.union_all()
+        if mode == "sample" and feature_count > sample_size:
+            chunks = _iter_layer_sample(path, layer, feature_count, sample_size, engine)
+        elif mode == "sample":
+            # small layer, the budget covers every feature
+            chunks = _iter_layer_chunks(path, layer, None, feature_count, max(feature_count, 1), engine)
+        else:
+            # geometry only, dates are pushed down to the data source below
+            chunks = _iter_layer_chunks(
+                path, layer, [], feature_count,
+                chunk_size or max(feature_count, 1), engine
+            )
 
-            # Oriented bounding box
-            obb = geom.minimum_rotated_rectangle
-            obb_coords = list(obb.exterior.coords)[:4]
+    else:
+        gdf = read_layer(path, layer=layer, engine=engine)
+        feature_count = len(gdf)
+
+        if empty_error and gdf.empty:
+            raise ValueError(empty_error)
+
+        if gdf.crs is None:
+            raise ValueError("Layer has no CRS defined")
+
+        # field types from the driver schema, as in the other modes
+        field_types = layer_field_types(pyogrio.read_info(path, layer=layer))
+        existing_date_cols = [col for col in DATE_COLUMNS if col in field_types]
+        chunks = [gdf]
+
+    # ---- Accumulate geometry and dates chunk by chunk ----
+    target_crs = pyproj.CRS.from_user_input(crs)
+    layer_crs = None
+    is_geographic = False
+    geometry_types = set()
+    bounds = np.array([np.inf, np.inf, -np.inf, -np.inf])
+    hull = None
+    geometries = []
+    column_dates = {col: [] for col in existing_date_cols}
+    memory_bytes = 0
+    sampled_count = 0
+    invalid_count = 0
+    repaired_count = 0
+    has_z = False
+    column_profile = TableProfile() if profile_columns and mode != "fast" else None
+    vertex_counts = []
+    part_counts = []
+    total_area = 0.0
+    total_length = 0.0
+
+    for gdf in chunks:
+        # Reproject if geographic (degrees)
+        if layer_crs is None:
+            is_geographic = resolve_epsg(gdf.crs) == 4326
+
+        if is_geographic and reproject == "layer":
+            gdf = gdf.to_crs(target_crs)  # choose correct UTM zone
+        layer_crs = gdf.crs
+        sampled_count += len(gdf)
+
+        # ---- Geometry cleanup (invalid features only) ----
+        gdf["geometry"], chunk_invalid, chunk_repaired = repair_geometries(gdf.geometry)
+        invalid_count += chunk_invalid
+        repaired_count += chunk_repaired
+
+        geometry_types.update(gdf.geom_type.unique())
+        chunk_bounds = gdf.total_bounds
+        bounds = np.concatenate([
+            np.fmin(bounds[:2], chunk_bounds[:2]),
+            np.fmax(bounds[2:], chunk_bounds[2:])
+        ])
+
+        if obb_method == "hull":
+            # running convex hull of everything seen so far
+            parts = gdf.geometry.dropna().to_numpy()
+            if hull is not None:
+                parts = np.append(parts, hull)
+            hull = shapely.convex_hull(shapely.geometrycollections(parts))
+        if obb_method == "union":
+            geometries.append(gdf.geometry)
+
+        if mode != "fast":
+            # ---- Temporal values ----
+            # parsed aside, the layer keeps its source dtypes for field_types
+            for col in existing_date_cols:
+                column_dates[col].append(pd.to_datetime(gdf[col], errors="coerce").dropna())
+
+        if mode != "fast":
+            memory_bytes += gdf.memory_usage(deep=True).sum()
+
+        if column_profile is not None:
+            column_profile.update(pd.DataFrame(gdf.drop(columns=gdf.geometry.name)))
+
+        # ---- Geometry complexity, area/length in a projected CRS ----
+        geoms = gdf.geometry.to_numpy()
+        if layer_crs.is_projected:
+            measured = geoms
+        elif reproject == "layer":
+            measured = gdf.geometry.to_crs(target_crs).to_numpy()
+        else:
+            measured = None  # footprint reprojection skips the per-feature transform
 
-            # ---- Spatial metadata ----
-            meta["crs"] = str(gdf.crs)
-            meta["epsg"] = gdf.crs.to_epsg() if gdf.crs else None
+        chunk_vertices, chunk_parts, chunk_area, chunk_length = geometry_complexity(geoms, measured)
+        vertex_counts.append(chunk_vertices)
+        part_counts.append(chunk_parts)
+        total_area = None if chunk_area is None or total_area is None else total_area + chunk_area
+        total_length = None if chunk_length is None or total_length is None else total_length + chunk_length
 
-            meta["geometry_types"] = ", ".join(sorted(gdf.geom_type.unique()))
-            meta["bbox"] = list(gdf.total_bounds)
-            meta["obb_bbox"] = obb_coords
-            meta["geometry"] = gdf.geometry  # adding geometry 
+        # ---- Z / M detection (best-effort) ----
+        try:
+            has_z = has_z or bool(gdf.geometry.has_z.any())
+        except Exception:
+            has_z = None
+
+    # ---- Oriented bounding box ----
+    if obb_method == "union":
+        # Dissolve all features
+        dissolved = pd.concat(geometries).union_all()
+        hull = dissolved.convex_hull
+        obb = dissolved.minimum_rotated_rectangle
+    else:
+        obb = hull.minimum_rotated_rectangle
+
+    if is_geographic and reproject == "footprint":
+        # only the hull leaves the layer CRS, not every feature
+        hull = gpd.GeoSeries([hull], crs=layer_crs).to_crs(target_crs).iloc[0]
+        obb = hull.minimum_rotated_rectangle
+        bounds = np.array(hull.bounds)
+        layer_crs = target_crs
+    obb_coords = list(obb.exterior.coords)[:4]
+
+    # ---- Extrapolate sampled counts to the whole layer ----
+    estimated = sampled_count < feature_count
+    scale = feature_count / sampled_count if estimated else 1
+    if estimated:
+        invalid_count = round(invalid_count * scale)
+        repaired_count = round(repaired_count * scale)
+
+    vertex_counts = np.concatenate(vertex_counts) if vertex_counts else np.array([], dtype=int)
+    part_counts = np.concatenate(part_counts) if part_counts else np.array([], dtype=int)
+
+    layer_meta = {}
+
+    # ---- Spatial metadata ----
+    layer_meta["crs"] = str(layer_crs)
+    layer_meta["epsg"] = resolve_epsg(layer_crs)
+    layer_meta["geometry_types"] = ", ".join(sorted(geometry_types))
+    layer_meta["bbox"] = list(bounds)
+    layer_meta["obb_bbox"] = obb_coords
+
+    # ---- Feature-level metadata ----
+    layer_meta["feature_count"] = feature_count
+    layer_meta["invalid_feature_count"] = invalid_count
+    layer_meta["repaired_feature_count"] = repaired_count
+    layer_meta["has_geometry"] = "geometry" in field_types
+
+    # ---- Geometry complexity (totals extrapolated in sample mode) ----
+    has_vertices = len(vertex_counts) > 0
+    layer_meta["vertex_count_total"] = round(int(vertex_counts.sum()) * scale)
+    layer_meta["vertex_count_max"] = int(vertex_counts.max()) if has_vertices else None
+    layer_meta["vertex_count_p50"] = float(np.percentile(vertex_counts, 50)) if has_vertices else None
+    layer_meta["vertex_count_p95"] = float(np.percentile(vertex_counts, 95)) if has_vertices else None
+    layer_meta["part_count_total"] = round(int(part_counts.sum()) * scale)
+    layer_meta["part_count_max"] = int(part_counts.max()) if has_vertices else None
+    layer_meta["total_area"] = None if total_area is None else round(total_area * scale, 3)
+    layer_meta["total_length"] = None if total_length is None else round(total_length * scale, 3)
+
+    # ---- Temporal metadata ----
+    layer_meta["has_timestamp"] = len(existing_date_cols) > 0
+    layer_meta["min_date"] = None
+    layer_meta["max_date"] = None
+
+    if layer_meta["has_timestamp"]:
+        if mode == "full":
+            all_dates = [dates for col in existing_date_cols for dates in column_dates[col]]
+        else:
+            all_dates = read_layer_date_extremes(
+                path, layer, existing_date_cols, info,
+                sampled_dates=column_dates if mode == "sample" else None
+            )
 
+        all_dates = pd.concat(all_dates, ignore_index=True)
 
-            # ---- Feature-level metadata ----
-            meta["feature_count"] = len(gdf)
-            meta["has_geometry"] = "geometry" in gdf.columns
+        if not all_dates.empty:
+            layer_meta["min_date"] = all_dates.min()
+            layer_meta["max_date"] = all_dates.max()
 
-            # ----- Temporal meta data -----
-            existing_date_cols = [col for col in DATE_COLUMNS if col in gdf.columns]
+    # ---- Attribute metadata ----
+    layer_meta["field_count"] = len(field_types)
+    layer_meta["field_names"] = ", ".join(field_types)
 
-            meta["has_timestamp"] = len(existing_date_cols) > 0
+    layer_meta["field_types"] = ", ".join(
+        f"{col}:{dtype}"
+        for col, dtype in field_types.items()
+    )
 
-            if meta["has_timestamp"]:
-                for col in existing_date_cols:
-                    gdf[col] = pd.to_datetime(gdf[col], errors="coerce")
+    derived_meta = {}
 
-                all_dates = pd.concat([gdf[col].dropna() for col in existing_date_cols])
+    # ---- Derived metadata ----
+    derived_meta["memory_mb"] = round(
+        memory_bytes * scale / (1024 ** 2), 3
+    ) if mode != "fast" else None
 
-                if not all_dates.empty:
-                    meta["min_date"] = all_dates.min()
-                    meta["max_date"] = all_dates.max()
-                else:
-                    meta["min_date"] = None
-                    meta["max_date"] = None
+    derived_meta["has_z"] = has_z
+    derived_meta["estimated"] = estimated
+    derived_meta["column_profile"] = column_profile.to_json() if column_profile is not None else None
 
+    # ---- Footprint (one polygon per layer, in the project CRS) ----
+    footprint_geom = obb if footprint == "obb" else hull
+    if layer_crs.to_wkt() != target_crs.to_wkt():
+        footprint_geom = gpd.GeoSeries([footprint_geom], crs=layer_crs).to_crs(target_crs).iloc[0]
+    derived_meta["footprint_wkb"] = footprint_geom.wkb_hex
 
-            # ---- Attribute metadata ----
-            meta["field_count"] = len(gdf.columns)
-            meta["field_names"] = ", ".join(gdf.columns)
+    return layer_meta, derived_meta
 
-            meta["field_types"] = ", ".join(
-                f"{col}:{dtype}"
-                for col, dtype in gdf.dtypes.items()
-            )
-            # ---- Filtering metadata ----
-            parts = layer.split('_')
-            meta["first_word"] = f"{parts[0]}_{parts[1]}"
+# function to extract one geodatabase layer's metadata row
+def extract_gdb_layer_row(gdb, layer, crs=CRS, **layer_options):
+    """
+    Returns the metadata row of one geodatabase layer, capturing failures
+    in status/error. layer_options go to read_layer_metadata_once.
+    """
+    meta = {
+        "geodatabase": gdb,
+        "layer": layer,
+        "layer_id": make_layer_id(gdb, layer),
+        "fingerprint": None,
+        "duplicate_of": None,
+        "status": "success",
+        "error": None
+    }
+
+    try:
+        # ---- Fingerprint, to spot copies of the same layer ----
+        meta["fingerprint"] = layer_fingerprint(gdb, layer, engine=layer_options.get("engine", "auto"))
+
+        # ---- Read layer and derive spatial, temporal, attribute metadata ----
+        layer_meta, derived_meta = read_layer_metadata_once(
+            gdb, layer, meta["fingerprint"], crs=crs, **layer_options
+        )
+        meta.update(layer_meta)
+
+        # ---- Filtering metadata ----
+        parts = layer.split('_')
+        meta["first_word"] = f"{parts[0]}_{parts[1]}"
+
+        gdb_parts = gdb.split(os.sep)
+       
+        # Normalize path parts once
+        gdb_parts_lower = [p.lower() for p in gdb_parts]
+
+        # ----- Species detection -----
+        meta["Species"] = find_match(SPECIES_TYPES, gdb_parts_lower)
+        meta["activity"] = find_match(ACTIVITY_TYPES, gdb_parts_lower)
+
+        # ---- Derived metadata ----
+        meta.update(derived_meta)
+
+    except (DriverError, DataSourceError, PermissionError) as e:
+        meta["status"] = "skipped"
+        meta["error"] = str(e)
+
+    except Exception as e:
+        meta["status"] = "failed"
+        meta["error"] = str(e)
+
+    return meta
+
+# function run by each worker process: all layers of one geodatabase
+def _extract_gdb_layer_group(gdb, indexed_layers, crs, layer_options):
+    """Extracts [(row_index, layer), ...] of one geodatabase and returns [(row_index, meta), ...]"""
+    return [
+        (idx, extract_gdb_layer_row(gdb, layer, crs=crs, **layer_options))
+        for idx, layer in indexed_layers
+    ]
+
+# function to group layer rows by geodatabase
+def _iter_gdb_groups(layers):
+    """
+    Yields (gdb, [(row_index, layer), ...]) from a layers DataFrame or a
+    stream of {'geodatabase', 'layer'} rows. A DataFrame is grouped as a
+    whole; a stream is grouped by consecutive rows, as iter_gdb_layers yields.
+    """
+    if isinstance(layers, pd.DataFrame):
+        if layers.empty:
+            return
+
+        groups = {}
+        for idx, (gdb, layer) in enumerate(zip(layers["geodatabase"], layers["layer"])):
+            groups.setdefault(gdb, []).append((idx, layer))
+        yield from groups.items()
+        return
+
+    current_gdb, group = None, []
+    for idx, row in enumerate(layers):
+        if group and row["geodatabase"] != current_gdb:
+            yield current_gdb, group
+            group = []
+        current_gdb = row["geodatabase"]
+        group.append((idx, row["layer"]))
+
+    if group:
+        yield current_gdb, group
 
-            gdb_parts = gdb.split(os.sep)
-           
-            # Normalize path parts once
-            gdb_parts_lower = [p.lower() for p in gdb_parts]
+# function to extract layers meta data
+def extract_gdb_layer_metadata(
+    layers_df,
+    output_csv,
+    crs=CRS,
+    workers=1,
+    footprint_output=None,
+    **layer_options
+):
+    """
+    Reads geodatabase layers and extracts metadata safely.
+    
+    Parameters
+    ----------
+    layers_df : pd.DataFrame or iterable of dict
+        Must contain columns: ['geodatabase', 'layer']. A stream of rows
+        (e.g. iter_gdb_layers) is extracted while it is still being listed.
+    output_csv : str or None
+        Path to save metadata CSV (None to only return the table)
+    workers : int
+        Number of processes. Layers of the same geodatabase always go to
+        the same worker; rows keep the order of layers_df. Workers are
+        spawned rather than forked, as listing threads (iter_gdb_layers)
+        may hold GDAL locks at that moment; callers need a __main__ guard.
+    footprint_output : str or None
+        GeoPackage (.gpkg) or GeoParquet (.parquet) receiving one footprint
+        polygon per layer, linked to the CSV rows by layer_id
+    **layer_options
+        mode, obb_method, chunk_size, engine... see read_vector_layer_metadata.
+        skip_duplicates=True reuses the metadata of the first layer with the
+        same fingerprint (per worker process) instead of reading a copy again.
 
-            # ----- Species detection -----
-            meta["Species"] = find_match(SPECIES_TYPES, gdb_parts_lower)
-            meta["activity"] = find_match(ACTIVITY_TYPES, gdb_parts_lower)
+    
+    Returns
+    -------
+    pd.DataFrame
+        Detailed metadata table; duplicate_of links copies to their first layer
+    """
 
-            # ---- Derived metadata ----
-            meta["memory_mb"] = round(
-                gdf.memory_usage(deep=True).sum() / (1024 ** 2), 3
-            )
+    _FINGERPRINT_METADATA.clear()
+    records = {}
+    total = len(layers_df) if isinstance(layers_df, pd.DataFrame) else None
 
-            # ---- Z / M detection (best-effort) ----
-            try:
-                meta["has_z"] = gdf.geometry.has_z.any()
-            except Exception:
-                meta["has_z"] = None
+    with tqdm(total=total, desc="Processing layers") as progress:
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                pending = set()
 
-        except (DriverError, PermissionError) as e:
-            meta["status"] = "skipped"
-            meta["error"] = str(e)
+                def collect(futures):
+                    for future in futures:
+                        rows = future.result()
+                        for idx, meta in rows:
+                            records[idx] = meta
+                        progress.update(len(rows))
 
-        except Exception as e:
-            meta["status"] = "failed"
-            meta["error"] = str(e)
+                # one task per geodatabase, submitted as soon as its layers are known
+                for gdb, indexed_layers in _iter_gdb_groups(layers_df):
+                    pending.add(pool.submit(_extract_gdb_layer_group, gdb, indexed_layers, crs, layer_options))
 
-        records.append(meta)
+                    done = {future for future in pending if future.done()}
+                    collect(done)
+                    pending -= done
+
+                collect(as_completed(pending))
+
+        else:
+            for gdb, indexed_layers in _iter_gdb_groups(layers_df):
+                for idx, layer in indexed_layers:
+                    records[idx] = extract_gdb_layer_row(gdb, layer, crs=crs, **layer_options)
+                    progress.update(1)
+
+    records = [records[idx] for idx in sorted(records)]
 
     # ---- Create DataFrame ----
-    meta_df = pd.DataFrame(records)
+    meta_df = mark_duplicates(pd.DataFrame(records))
 
-    # ---- Save CSV ----
-    meta_df.to_csv(output_csv, index=False, encoding="utf-8")
+    # ---- Save CSV and footprints ----
+    if output_csv:
+        write_metadata_csv(meta_df, output_csv)
 
-    # return meta_df
+    if footprint_output:
+        write_footprints(meta_df, footprint_output, crs=crs)
+
+    return meta_df
 
 # function to extract shapefiles metadata
 def extract_shapefile_metadata(
     shp_paths,
     output_csv,
-    crs=CRS
+    crs=CRS,
+    footprint_output=None,
+    **layer_options
 ):
     """
     Reads shapefiles and extracts metadata safely.
@@ -375,15 +1371,22 @@ def extract_shapefile_metadata(
     ----------
     shp_paths : list[str]
         List of full paths to shapefiles
-    output_csv : str
-        Path to save metadata CSV
+    output_csv : str or None
+        Path to save metadata CSV (None to only return the table)
+    footprint_output : str or None
+        GeoPackage (.gpkg) or GeoParquet (.parquet) receiving one footprint
+        polygon per layer, linked to the CSV rows by layer_id
+    **layer_options
+        mode, obb_method, chunk_size, engine, skip_duplicates... see
+        read_vector_layer_metadata and extract_gdb_layer_metadata
 
     Returns
     -------
     pd.DataFrame
-        Detailed metadata table
+        Detailed metadata table; duplicate_of links copies to their first layer
     """
 
+    _FINGERPRINT_METADATA.clear()
     records = []
 
     for shp in tqdm(shp_paths):
@@ -393,77 +1396,23 @@ def extract_shapefile_metadata(
         meta = {
             "shapefile_path": shp,
             "layer_name": layer_name,
+            "layer_id": make_layer_id(shp),
+            "fingerprint": None,
+            "duplicate_of": None,
             "status": "success",
             "error": None
         }
 
         try:
-            # ---- Read shapefile ----
-            gdf = gpd.read_file(shp)
-
-            if gdf.empty:
-                raise ValueError("Shapefile contains no features")
-
-            if gdf.crs is None:
-                raise ValueError("Layer has no CRS defined")
-
-            # ---- CRS handling ----
-            epsg = gdf.crs.to_epsg()
-            if epsg == 4326:
-                gdf = gdf.to_crs(crs)  
-
-            # ---- Geometry cleanup ----
-            gdf["geometry"] = gdf.geometry.make_valid()
-
-            geom = gdf.geometry.union_all()
+            # ---- Fingerprint, to spot copies of the same layer ----
+            meta["fingerprint"] = layer_fingerprint(shp, engine=layer_options.get("engine", "auto"))
 
-            # ---- Oriented bounding box ----
-            obb = geom.minimum_rotated_rectangle
-            obb_coords = list(obb.exterior.coords)[:4]
-
-            # ---- Spatial metadata ----
-            meta["crs"] = str(gdf.crs)
-            meta["epsg"] = gdf.crs.to_epsg()
-            meta["geometry_types"] = ", ".join(sorted(gdf.geom_type.unique()))
-            meta["bbox"] = list(gdf.total_bounds)
-            meta["obb_bbox"] = obb_coords
-
-
-            # ---- Feature-level metadata ----
-            meta["feature_count"] = len(gdf)
-            meta["has_geometry"] = "geometry" in gdf.columns
-
-            # ---- Temporal metadata ----
-            existing_date_cols = [col for col in DATE_COLUMNS if col in gdf.columns]
-            meta["has_timestamp"] = len(existing_date_cols) > 0
-
-            if meta["has_timestamp"]:
-                for col in existing_date_cols:
-                    gdf[col] = pd.to_datetime(gdf[col], errors="coerce")
-
-                all_dates = pd.concat(
-                    [gdf[col].dropna() for col in existing_date_cols],
-                    ignore_index=True
-                )
-
-                if not all_dates.empty:
-                    meta["min_date"] = all_dates.min()
-                    meta["max_date"] = all_dates.max()
-                else:
-                    meta["min_date"] = None
-                    meta["max_date"] = None
-            else:
-                meta["min_date"] = None
-                meta["max_date"] = None
-
-            # ---- Attribute metadata ----
-            meta["field_count"] = len(gdf.columns)
-            meta["field_names"] = ", ".join(gdf.columns)
-
-            meta["field_types"] = ", ".join(
-                f"{col}:{dtype}"
-                for col, dtype in gdf.dtypes.items()
+            # ---- Read shapefile and derive spatial, temporal, attribute metadata ----
+            layer_meta, derived_meta = read_layer_metadata_once(
+                shp, None, meta["fingerprint"], crs=crs,
+                empty_error="Shapefile contains no features", **layer_options
             )
+            meta.update(layer_meta)
 
             # ---- Path-based metadata ----
             shp_parts = shp.split(os.sep)
@@ -473,17 +1422,9 @@ def extract_shapefile_metadata(
             meta["activity"] = find_match(ACTIVITY_TYPES, shp_parts_lower)
 
             # ---- Derived metadata ----
-            meta["memory_mb"] = round(
-                gdf.memory_usage(deep=True).sum() / (1024 ** 2), 3
-            )
+            meta.update(derived_meta)
 
-            # ---- Z / M detection ----
-            try:
-                meta["has_z"] = gdf.geometry.has_z.any()
-            except Exception:
-                meta["has_z"] = None
-
-        except (DriverError, PermissionError) as e:
+        except (DriverError, DataSourceError, PermissionError) as e:
             meta["status"] = "skipped"
             meta["error"] = str(e)
 
@@ -494,27 +1435,397 @@ def extract_shapefile_metadata(
         records.append(meta)
 
     # ---- Create DataFrame ----
-    meta_df = pd.DataFrame(records)
+    meta_df = mark_duplicates(pd.DataFrame(records))
 
-    # ---- Save CSV ----
-    meta_df.to_csv(output_csv, index=False, encoding="utf-8")
+    # ---- Save CSV and footprints ----
+    if output_csv:
+        write_metadata_csv(meta_df, output_csv)
+
+    if footprint_output:
+        write_footprints(meta_df, footprint_output, crs=crs)
     
-    # return meta_df
+    return meta_df
+
+# function to describe the column types and dates of a table sample
+def describe_table_sample(meta, df, profile_columns=False, coordinate_crs=None):
+    """
+    Fills column_types, has_timestamp, min_date, max_date (and
+    column_profile, and the spatial columns of a point table) of meta from df
+    """
+    if coordinate_crs:
+        coordinates = detect_coordinate_columns(df, coordinate_crs)
+        if coordinates:
+            point_extent = PointExtent(*coordinates, coordinate_crs)
+            point_extent.update(df)
+            describe_point_extent(meta, point_extent)
+            # only the rows read were counted, not the table
+            meta["feature_count"] = None
+            meta["out_of_area_count"] = None
+
+    meta["column_types"] = ", ".join(
+        f"{c}:{t}" for c, t in df.dtypes.items()
+    )
+
+    if profile_columns:
+        column_profile = TableProfile()
+        column_profile.update(df)
+        meta["column_profile"] = column_profile.to_json()
+
+    # ---- Temporal column detection ----
+    date_cols = [c for c in DATE_COLUMNS if c in df.columns]
+
+    if date_cols:
+        meta["has_timestamp"] = True
+
+        for c in date_cols:
+            df[c] = pd.to_datetime(df[c], errors="coerce")
+
+        all_dates = pd.concat([df[c].dropna() for c in date_cols])
+
+        if not all_dates.empty:
+            meta["min_date"] = all_dates.min()
+            meta["max_date"] = all_dates.max()
+
+# function to pick the csv engine
+def resolve_csv_engine(engine):
+    """'auto' and 'arrow' use pyarrow when it is installed, anything else pandas"""
+    if engine not in ("auto", "arrow", "pandas"):
+        raise ValueError(f"Unknown CSV engine: {engine}")
+    return "arrow" if engine != "pandas" and HAS_ARROW else "pandas"
+
+# function to read a csv in chunks with the selected engine
+def iter_csv_chunks(file_path, chunk_size=100_000, engine="auto", block_size=ARROW_CSV_BLOCK_SIZE):
+    """
+    Yields a CSV as DataFrames.
+
+    'pandas' runs the C parser on chunk_size rows at a time. 'arrow' runs
+    pyarrow's multithreaded streaming reader on block_size bytes at a time;
+    column types are fixed by the first block. Both engines give the same
+    dtypes: dates and times stay text, text columns get pandas' string
+    dtype, empty fields are nulls and all-empty columns are float64.
+    file_path may also be a binary buffer.
+    """
+    if resolve_csv_engine(engine) == "pandas":
+        yield from pd.read_csv(file_path, chunksize=chunk_size)
+        return
+
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=block_size)
+    reader = pacsv.open_csv(
+        file_path, read_options=read_options,
+        convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+    )
+
+    # Arrow always infers dates, times and timestamps; pandas keeps them as text
+    temporal = {f.name: pyarrow.string() for f in reader.schema if pyarrow.types.is_temporal(f.type)}
+    if temporal:
+        reader.close()
+        if hasattr(file_path, "seek"):
+            file_path.seek(0)
+        reader = pacsv.open_csv(
+            file_path, read_options=read_options,
+            convert_options=pacsv.ConvertOptions(strings_can_be_null=True, column_types=temporal),
+        )
+
+    empty = [f.name for f in reader.schema if pyarrow.types.is_null(f.type)]
+    for batch in reader:
+        chunk = batch.to_pandas(types_mapper=_arrow_pandas_type)
+        if empty:
+            chunk[empty] = chunk[empty].astype("float64")
+        yield chunk
+
+# function to map Arrow column types to the pandas dtypes read_csv gives
+def _arrow_pandas_type(arrow_type):
+    """Text columns get PANDAS_STRING_DTYPE, anything else the default conversion"""
+    if pyarrow.types.is_string(arrow_type) and isinstance(PANDAS_STRING_DTYPE, pd.api.extensions.ExtensionDtype):
+        return PANDAS_STRING_DTYPE
+    return None
+
+# function to read the first rows of a csv with the selected engine
+def read_csv_sample(file_path, nrows, engine="auto"):
+    """Returns the first nrows of a CSV, falling back to pandas when Arrow cannot parse it"""
+    if resolve_csv_engine(engine) == "arrow":
+        try:
+            chunks, rows = [], 0
+            for chunk in iter_csv_chunks(file_path, engine="arrow", block_size=1024 ** 2):
+                chunks.append(chunk)
+                rows += len(chunk)
+                if rows >= nrows:
+                    break
+            if chunks:
+                return pd.concat(chunks, ignore_index=True).head(nrows)
+        except pyarrow.ArrowException as e:
+            logging.warning(f"Arrow CSV read failed for {file_path}, using pandas: {e}")
+
+    return pd.read_csv(file_path, nrows=nrows)
+
+# function to profile a csv in one streaming pass
+def profile_csv(file_path, chunk_size=100_000, date_columns=DATE_COLUMNS, profile_columns=False, coordinate_crs=None,
+                engine="auto"):
+    """
+    Reads a CSV once in chunks and returns its row count, column dtypes
+    and the true min/max over date_columns. Peak memory is set by
+    chunk_size (or the Arrow block size) rather than by the file size.
+
+    With profile_columns, per-column null counts, min/max and approximate
+    distinct counts are gathered in the same pass (see sketches.TableProfile).
+    With coordinate_crs, coordinate columns are detected on the first chunk
+    and the point count, bbox and hull are tracked in that CRS.
+
+    engine is 'auto', 'arrow' or 'pandas' (see iter_csv_chunks). A file the
+    Arrow reader cannot parse (e.g. a column changing type after the first
+    block) is profiled again with pandas.
+
+    Returns
+    -------
+    dict
+        row_count, dtypes ({column: dtype}), date_columns, min_date,
+        max_date, column_profile (TableProfile or None), point_extent
+        (PointExtent or None)
+    """
+    options = (file_path, date_columns, profile_columns, coordinate_crs)
+
+    if resolve_csv_engine(engine) == "arrow":
+        try:
+            return _profile_csv_chunks(iter_csv_chunks(file_path, engine="arrow"), *options)
+        except pyarrow.ArrowException as e:
+            logging.warning(f"Arrow CSV read failed for {file_path}, using pandas: {e}")
+
+    return _profile_csv_chunks(iter_csv_chunks(file_path, chunk_size, engine="pandas"), *options)
+
+# function to fold csv chunks into a profile (see profile_csv)
+def _profile_csv_chunks(chunks, file_path, date_columns, profile_columns, coordinate_crs):
+    column_profile = TableProfile() if profile_columns else None
+    point_extent = None
+    row_count = 0
+    dtypes = {}
+    min_date, max_date = None, None
+    existing_date_cols = []
+
+    for chunk in chunks:
+        if not dtypes:
+            dtypes = dict(chunk.dtypes)
+            existing_date_cols = [c for c in date_columns if c in chunk.columns]
+
+            coordinates = detect_coordinate_columns(chunk, coordinate_crs) if coordinate_crs else None
+            if coordinates:
+                point_extent = PointExtent(*coordinates, coordinate_crs)
+        else:
+            dtypes = {c: merge_dtypes(dtypes[c], t) for c, t in chunk.dtypes.items()}
+        row_count += len(chunk)
+
+        if column_profile is not None:
+            column_profile.update(chunk)
+
+        if point_extent is not None:
+            point_extent.update(chunk)
+
+        # ---- Running date extremes ----
+        for c in existing_date_cols:
+            dates = pd.to_datetime(chunk[c], errors="coerce").dropna()
+            if dates.empty:
+                continue
+            min_date = dates.min() if min_date is None else min(min_date, dates.min())
+            max_date = dates.max() if max_date is None else max(max_date, dates.max())
+
+    if not dtypes:
+        # header only: no chunk is produced
+        dtypes = dict(pd.read_csv(file_path, nrows=0).dtypes)
+        existing_date_cols = [c for c in date_columns if c in dtypes]
+
+    return {
+        "row_count": row_count,
+        "dtypes": dtypes,
+        "date_columns": existing_date_cols,
+        "min_date": min_date,
+        "max_date": max_date,
+        "column_profile": column_profile,
+        "point_extent": point_extent,
+    }
+
+# function to fill the spatial columns of a point table
+def describe_point_extent(meta, point_extent):
+    """Copies x/y columns, crs, bbox, obb_bbox, point count and footprint into meta"""
+    meta["x_column"] = point_extent.x_column
+    meta["y_column"] = point_extent.y_column
+    meta.update(point_extent.to_meta())
+
+# function to count the data rows of a csv without decoding it
+def count_csv_rows(file_path, quote_aware=False, block_size=4 * 1024 ** 2):
+    """
+    Returns the number of data rows of a CSV (records after the header).
+
+    The file is read in large binary blocks and newlines are counted
+    without decoding text. A last line without a trailing newline still
+    counts as a row.
+
+    Parameters
+    ----------
+    file_path : str
+        CSV file
+    quote_aware : bool
+        Ignore newlines inside double-quoted fields, so records with
+        embedded line breaks count once. A newline only ends a record when
+        an even number of quotes precedes it (escaped "" quotes cancel out).
+    block_size : int
+        Bytes read at a time
+    """
+    lines = 0
+    quote_parity = 0
+    last_byte = b"\n"
+
+    with open(file_path, "rb") as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            last_byte = block[-1:]
+
+            if not quote_aware or (not quote_parity and b'"' not in block):
+                lines += block.count(b"\n")
+                continue
+
+            data = np.frombuffer(block, dtype=np.uint8)
+            # running count of quotes modulo 2 (uint8 overflow keeps the parity)
+            parity = (np.cumsum(data == ord('"'), dtype=np.uint8) + quote_parity) & 1
+            lines += int(np.count_nonzero((data == ord("\n")) & (parity == 0)))
+            quote_parity = int(parity[-1])
+
+    if last_byte != b"\n":
+        lines += 1  # unterminated last line
+
+    return max(lines - 1, 0)
+
+# function to read an evenly strided sample of the lines of a csv
+def sample_csv_lines(file_path, sample_size=10_000, blocks=10):
+    """
+    Returns (header, lines, complete).
+
+    Files of at most sample_size lines are read whole (complete is True).
+    Otherwise about sample_size lines are read as contiguous blocks spread
+    evenly over the file, as _iter_layer_sample does for layers: the data is
+    split into equal byte ranges and each block seeks to the start of its
+    range and begins at the next line.
+    """
+    blocks = max(1, min(blocks, sample_size))
+    block_lines = -(-sample_size // blocks)
+    file_size = os.path.getsize(file_path)
+
+    with open(file_path, "rb") as f:
+        header = f.readline()
+        data_start = f.tell()
+        lines = list(islice(f, sample_size + 1))
+        if len(lines) <= sample_size:
+            return header, lines, True
+
+        lines = lines[:block_lines]
+        end = data_start + sum(len(line) for line in lines)
+        offsets = data_start + (file_size - data_start) * np.arange(1, blocks) // blocks
+
+        for offset in offsets:
+            if offset < end:
+                continue  # overlaps the previous block
+            # the byte before offset ends a line, or the partial line is skipped
+            f.seek(offset - 1)
+            f.readline()
+            lines.extend(islice(f, block_lines))
+            end = f.tell()
+
+    return header, lines, False
+
+# function to parse a strided csv sample with the selected engine
+def read_csv_lines(file_path, header, lines, engine="auto"):
+    """
+    Returns the DataFrame of header + lines (see sample_csv_lines). When a
+    block started inside a quoted field spanning several lines and cannot
+    be parsed, the first len(lines) rows of the file are read instead.
+    """
+    try:
+        chunks = iter_csv_chunks(io.BytesIO(header + b"".join(lines)), len(lines) or 1, engine=engine)
+        return pd.concat(chunks, ignore_index=True)
+    except Exception as e:
+        logging.warning(f"Strided CSV sample failed for {file_path}, reading the first rows: {e}")
+        return read_csv_sample(file_path, len(lines), engine=engine)
+
+# function to estimate the row count of a csv from a sample of its lines
+def estimate_csv_rows(file_path, sample_size=10_000, sample=None):
+    """
+    Returns (row_count, estimated).
+
+    Extrapolates the average line length of a strided sample of lines
+    (sample_csv_lines, or sample when it was already read) to the file
+    size. Files shorter than the sample are counted exactly.
+    """
+    header, lines, complete = sample or sample_csv_lines(file_path, sample_size)
+
+    if complete:
+        return len(lines), False
+
+    bytes_per_row = sum(len(line) for line in lines) / len(lines)
+    data_bytes = os.path.getsize(file_path) - len(header)
+
+    return round(data_bytes / bytes_per_row), True
 
 # function to extract csv meta data 
 def extract_table_metadata(
     table_paths,
-    output_csv
+    output_csv,
+    mode="full",
+    sample_size=10_000,
+    quote_aware=False,
+    chunk_size=100_000,
+    profile_columns=False,
+    crs=CRS,
+    detect_coordinates=True,
+    footprint_output=None,
+    csv_engine="auto"
 ):
     """
     Extracts metadata from CSV and Excel files (.csv, .xlsx, .xls).
+    Excel workbooks give one row per sheet (sheet_name).
 
     Parameters
     ----------
     table_paths : list[str]
         List of full paths to CSV / Excel files
-    output_csv : str
-        Path to save metadata CSV
+    output_csv : str or None
+        Path to save metadata CSV (None to only return the table)
+    mode : str
+        'full' profiles each CSV in one chunked pass (profile_csv): exact
+        row count, dtypes merged over all chunks and true date ranges.
+        'fast' counts rows from binary blocks (count_csv_rows) and takes
+        column types and dates from the first 1000 rows.
+        'sample' reads about sample_size CSV rows in evenly spaced blocks
+        (sample_csv_lines) for column types and dates and extrapolates the
+        row count from their average size; such rows are flagged 'estimated'.
+    sample_size : int
+        'sample' mode only: rows read per file
+    quote_aware : bool
+        'fast' mode only: count quoted fields with embedded newlines as
+        one row (see count_csv_rows)
+    chunk_size : int
+        'full' mode only: CSV rows parsed at a time
+    profile_columns : bool
+        Add a 'column_profile' (JSON list of per-column null count, min,
+        max and approximate distinct count) written by write_column_profiles.
+        Full-mode CSVs are profiled over every row, other tables over the
+        rows read for their column types (see rows_profiled).
+    crs : str
+        Project CRS of the spatial columns (and of unlabelled easting/northing)
+    detect_coordinates : bool
+        Look for Lat/Lon, Easting/Northing or X/Y columns (coordinate_columns).
+        Point tables get the spatial columns of the vector layers (crs, epsg,
+        geometry_types, bbox, obb_bbox, feature_count = valid points,
+        has_geometry) in crs, plus x_column/y_column. Points outside the
+        area of use of their CRS are left out and counted in
+        out_of_area_count. Full-mode CSVs are measured over every row,
+        other tables over the rows read, with feature_count and
+        out_of_area_count left empty.
+    footprint_output : str or None
+        GeoPackage (.gpkg) or GeoParquet (.parquet) receiving the footprint
+        of every point table, linked to the CSV rows by layer_id
+    csv_engine : str
+        CSV parser for the sample and the profiling pass: 'auto' (Arrow's
+        multithreaded reader when pyarrow is installed), 'arrow' or 'pandas'
 
     Returns
     -------
@@ -522,6 +1833,10 @@ def extract_table_metadata(
         Tabular metadata table
     """
 
+    if mode not in ("full", "fast", "sample"):
+        raise ValueError(f"Unknown metadata mode: {mode}")
+
+    coordinate_crs = crs if detect_coordinates else None
     records = []
 
     for file_path in tqdm(table_paths):
@@ -535,10 +1850,13 @@ def extract_table_metadata(
             "file_path": file_path,
             "file_name": file_name,
             "file_extension": ext,
+            "layer_id": make_layer_id(file_path),
             "status": "success",
             "error": None
         }
 
+        rows = [meta]
+
         try:
             # ---- File system metadata ----
             stat = os.stat(file_path)
@@ -565,115 +1883,307 @@ def extract_table_metadata(
             meta["column_types"] = None
             meta["sheet_count"] = None
             meta["sheet_names"] = None
+            meta["sheet_name"] = None
             meta["has_timestamp"] = False
             meta["min_date"] = None
             meta["max_date"] = None
+            meta["estimated"] = False
+
+            # ---- Spatial metadata (point tables only) ----
+            meta["x_column"] = None
+            meta["y_column"] = None
+            meta["crs"] = None
+            meta["epsg"] = None
+            meta["geometry_types"] = None
+            meta["bbox"] = None
+            meta["obb_bbox"] = None
+            meta["feature_count"] = None
+            meta["out_of_area_count"] = None
+            meta["has_geometry"] = False
 
             # ---- CSV handling ----
             if ext == ".csv":
-                df = pd.read_csv(file_path, nrows=1000)
-
-                meta["row_count"] = sum(1 for _ in open(file_path, encoding="utf-8", errors="ignore")) - 1
-                meta["column_count"] = len(df.columns)
-                meta["column_names"] = ", ".join(df.columns)
-                meta["column_types"] = ", ".join(
-                    f"{c}:{t}" for c, t in df.dtypes.items()
-                )
+                if mode == "full":
+                    # single pass: row count, merged dtypes and true date range
+                    profile = profile_csv(
+                        file_path, chunk_size=chunk_size, profile_columns=profile_columns,
+                        coordinate_crs=coordinate_crs, engine=csv_engine
+                    )
+
+                    meta["row_count"] = profile["row_count"]
+                    meta["column_count"] = len(profile["dtypes"])
+                    meta["column_names"] = ", ".join(profile["dtypes"])
+                    meta["column_types"] = ", ".join(
+                        f"{c}:{t}" for c, t in profile["dtypes"].items()
+                    )
+                    meta["has_timestamp"] = len(profile["date_columns"]) > 0
+                    meta["min_date"] = profile["min_date"]
+                    meta["max_date"] = profile["max_date"]
+
+                    if profile_columns:
+                        meta["column_profile"] = profile["column_profile"].to_json()
+
+                    if profile["point_extent"] is not None:
+                        describe_point_extent(meta, profile["point_extent"])
 
-            # ---- Excel handling ----
+                else:
+                    if mode == "sample":
+                        # one strided read gives the sample rows and the row estimate
+                        sample = sample_csv_lines(file_path, sample_size)
+                        if sample[2]:
+                            df = read_csv_sample(file_path, sample_size, engine=csv_engine)
+                        else:
+                            df = read_csv_lines(file_path, *sample[:2], engine=csv_engine)
+                        meta["row_count"], meta["estimated"] = estimate_csv_rows(file_path, sample=sample)
+                    else:
+                        df = read_csv_sample(file_path, 1000, engine=csv_engine)
+                        meta["row_count"] = count_csv_rows(file_path, quote_aware=quote_aware)
+
+                    meta["column_count"] = len(df.columns)
+                    meta["column_names"] = ", ".join(df.columns)
+                    describe_table_sample(meta, df, profile_columns, coordinate_crs)
+
+            # ---- Excel handling (one row per sheet) ----
             elif ext in [".xlsx", ".xls"]:
-                xls = pd.ExcelFile(file_path)
-
-                meta["sheet_count"] = len(xls.sheet_names)
-                meta["sheet_names"] = ", ".join(xls.sheet_names)
-
-                df = xls.parse(xls.sheet_names[0], nrows=1000)
-
-                meta["column_count"] = len(df.columns)
-                meta["column_names"] = ", ".join(df.columns)
-                meta["column_types"] = ", ".join(
-                    f"{c}:{t}" for c, t in df.dtypes.items()
-                )
-
-                meta["row_count"] = None  # avoid loading full sheets
+                # sizes and headers come from the workbook structure
+                sheets = probe_excel(file_path)
+
+                meta["sheet_count"] = len(sheets)
+                meta["sheet_names"] = ", ".join(sheet["sheet_name"] for sheet in sheets)
+
+                # types and dates from the first 1000 rows, streamed sheet by sheet
+                engine_kwargs = {"on_demand": True} if ext == ".xls" else None
+                sheet_rows = []
+
+                with pd.ExcelFile(file_path, engine_kwargs=engine_kwargs) as xls:
+                    for sheet in sheets:
+                        sheet_meta = dict(meta)
+                        sheet_meta["sheet_name"] = sheet["sheet_name"]
+                        sheet_meta["layer_id"] = make_layer_id(file_path, sheet["sheet_name"])
+                        sheet_meta["row_count"] = sheet["row_count"]
+                        sheet_meta["column_count"] = sheet["column_count"]
+                        sheet_meta["column_names"] = ", ".join(sheet["column_names"])
+
+                        # pandas parses from column A; keep the probed columns so that
+                        # column_types line up with column_names
+                        df = xls.parse(sheet["sheet_name"], header=sheet["header_row"] - 1, nrows=1000)
+                        df = df.iloc[:, sheet["first_column"] - 1:sheet["last_column"]]
+                        describe_table_sample(sheet_meta, df, profile_columns, coordinate_crs)
+                        sheet_rows.append(sheet_meta)
+
+                rows = sheet_rows or [meta]
 
             else:
                 raise ValueError(f"Unsupported file type: {ext}")
 
-            # ---- Temporal column detection ----
-            date_cols = [c for c in DATE_COLUMNS if c in df.columns]
-
-            if date_cols:
-                meta["has_timestamp"] = True
-
-                for c in date_cols:
-                    df[c] = pd.to_datetime(df[c], errors="coerce")
-
-                all_dates = pd.concat([df[c].dropna() for c in date_cols])
-
-                if not all_dates.empty:
-                    meta["min_date"] = all_dates.min()
-                    meta["max_date"] = all_dates.max()
-
         except PermissionError as e:
             meta["status"] = "skipped"
             meta["error"] = str(e)
+            rows = [meta]
 
         except Exception as e:
             meta["status"] = "failed"
             meta["error"] = str(e)
+            rows = [meta]
 
-        records.append(meta)
+        records.extend(rows)
 
     # ---- Create DataFrame ----
     meta_df = pd.DataFrame(records)
 
-    # ---- Save CSV ----
-    meta_df.to_csv(output_csv, index=False, encoding="utf-8")
+    # ---- Save CSV and point table footprints ----
+    if output_csv:
+        write_metadata_csv(meta_df, output_csv)
 
-    # return meta_df
+    if footprint_output:
+        write_footprints(meta_df, footprint_output, crs=crs)
 
-# processing geo dbs
-def process_geodatabases(ROOT_DIRS,OUTPUT_GDB_METADATA_CSV):
-    # Get geo dbs to list
-    _, gdb_paths = get_geodbs_to_list(root_dirs=ROOT_DIRS)
-    
-    # get layers
-    layers = get_gdb_layers(gdb_paths)
-    lyrs_df = pd.DataFrame(layers) 
+    return meta_df
 
-    # extract meta data for each geo database layer and save csv
-    extract_gdb_layer_metadata(
-        lyrs_df,
-        output_csv=OUTPUT_GDB_METADATA_CSV)
+# row schema version of each document type: bump when an extractor's row
+# columns or their meaning change, so rows cached by older code are re-extracted
+# (image 2: layer_id, decoded GPS columns, captured_time and photo points;
+# table 2: out_of_area_count, no sampled feature_count; gdb and shapefile 2:
+# field_types from the driver schema)
+ROW_SCHEMA_VERSIONS = {"gdb": 2, "shapefile": 2, "table": 2, "image": 2}
+
+# extractor parameters that change how rows are produced or saved, not their content
+RUN_ONLY_OPTIONS = {"output_csv", "footprint_output", "profile_output", "workers", "listing_workers", "max_in_flight"}
+
+# function to key cached rows by the options and schema they were extracted with
+def extraction_key(doc_type, extractor, options):
+    """
+    Returns a short hash of the row schema version of doc_type and the
+    effective extraction options: the defaults of extractor overridden by
+    options. Cached rows stored under another key are re-extracted.
+    """
+    effective = {
+        name: parameter.default
+        for name, parameter in inspect.signature(extractor).parameters.items()
+        if parameter.default is not inspect.Parameter.empty
+    }
+    effective.update(options)
+    effective = {name: value for name, value in effective.items() if name not in RUN_ONLY_OPTIONS}
+
+    key = json.dumps({"schema": ROW_SCHEMA_VERSIONS[doc_type], "options": effective}, sort_keys=True, default=str)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+# function to run an extractor incrementally against the inventory cache
+def extract_incremental(
+    doc_type,
+    paths,
+    extract,
+    path_column,
+    output_csv,
+    root_dirs,
+    inventory_db=None,
+    footprint_output=None,
+    profile_output=None,
+    options_key=None
+):
+    """
+    Extracts only new or changed documents and merges them with cached rows.
+
+    Parameters
+    ----------
+    doc_type : str
+        Inventory bucket name, e.g. 'gdb'
+    paths : list[str]
+        Crawled document paths
+    extract : callable
+        extract(paths) -> pd.DataFrame of metadata rows
+    path_column : str
+        Column of the metadata rows holding the document path
+    output_csv : str
+        Path to save the merged metadata CSV
+    root_dirs : list[str]
+        Scanned roots; cached paths under them that vanished are marked removed
+    inventory_db : str or None
+        SQLite inventory file. None extracts everything, as before.
+    footprint_output : str or None
+        Footprint catalog written from the merged rows (geo documents only)
+    profile_output : str or None
+        Long-format column profiles CSV written from the merged rows
+    options_key : str or None
+        extraction_key of this run; documents cached under another key
+        (other options or an older row schema) are extracted again
+
+    Returns
+    -------
+    pd.DataFrame
+        Metadata rows for every crawled path plus removed ones
+    """
+    if inventory_db is None:
+        meta_df = extract(paths)
+        save_outputs(meta_df, output_csv, footprint_output, profile_output)
+        return meta_df
+
+    cache = InventoryCache(inventory_db)
+    try:
+        changed, unchanged, removed, signatures = cache.plan(doc_type, paths, root_dirs, options_key)
+        print(f"{doc_type}: {len(changed)} new/changed, {len(unchanged)} unchanged, {len(removed)} removed")
+
+        new_df = extract(changed)
+        cache.store(doc_type, new_df, path_column, signatures, options_key)
+
+        frames = [
+            new_df,
+            cache.load_rows(doc_type, unchanged),
+            cache.mark_removed(doc_type, removed),
+        ]
+    finally:
+        cache.close()
+
+    frames = [f for f in frames if not f.empty]
+    meta_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    # keep the crawl order, removed documents last
+    if not meta_df.empty:
+        order = {path: i for i, path in enumerate(paths)}
+        meta_df = meta_df.sort_values(
+            path_column, key=lambda col: col.map(order).fillna(len(order)), kind="stable"
+        ).reset_index(drop=True)
+
+    # copies may sit in cached and freshly extracted documents
+    meta_df = mark_duplicates(meta_df)
+
+    save_outputs(meta_df, output_csv, footprint_output, profile_output)
+    return meta_df
+
+# function to save a metadata table and, for geo layers, its footprints
+def save_outputs(meta_df, output_csv, footprint_output=None, profile_output=None):
+    write_metadata_csv(meta_df, output_csv)
+
+    if footprint_output:
+        write_footprints(meta_df, footprint_output)
+
+    if profile_output:
+        write_column_profiles(meta_df, profile_output)
+
+# processing geo dbs
+def process_geodatabases(ROOT_DIRS,OUTPUT_GDB_METADATA_CSV, inventory=None, inventory_db=None, workers=1, layer_options=None, footprint_output=None, listing_workers=8, profile_output=None):
+    # Get geo dbs to list (reuse the shared crawl when given)
+    if inventory is None:
+        inventory = crawl_inventory(ROOT_DIRS)
+    gdb_paths = inventory["gdb"]
+    layer_options = {**(layer_options or {}), "profile_columns": profile_output is not None}
+
+    # stream layers into the extraction while the remaining geodatabases are listed
+    def extract(paths):
+        layers = iter_gdb_layers(paths, workers=listing_workers)
+        return extract_gdb_layer_metadata(layers, output_csv=None, workers=workers, **layer_options)
+
+    # save csv (only new or changed geodatabases are read when inventory_db is set)
+    extract_incremental("gdb", gdb_paths, extract, "geodatabase",
+                        OUTPUT_GDB_METADATA_CSV, ROOT_DIRS, inventory_db, footprint_output, profile_output,
+                        extraction_key("gdb", read_vector_layer_metadata, layer_options))
 
     print(f"geodatabases meta data printed successfully to {OUTPUT_GDB_METADATA_CSV}")
 
 # processing shapefiles
-def process_shapefiles(ROOT_DIRS, OUTPUT_SHP_METADATA_CSV):
+def process_shapefiles(ROOT_DIRS, OUTPUT_SHP_METADATA_CSV, inventory=None, inventory_db=None, layer_options=None, footprint_output=None, profile_output=None):
 # check all shape files and geopackages
-    shp_paths = get_files_to_list(ROOT_DIRS, files_endwith=SHAPEFILES_EXTENSIONS)
+    if inventory is None:
+        inventory = crawl_inventory(ROOT_DIRS)
+    shp_paths = inventory["shapefile"]
+    layer_options = {**(layer_options or {}), "profile_columns": profile_output is not None}
 
     # get shp meta data to csv
-    extract_shapefile_metadata(shp_paths, output_csv=OUTPUT_SHP_METADATA_CSV)
+    extract_incremental(
+        "shapefile", shp_paths,
+        lambda paths: extract_shapefile_metadata(paths, output_csv=None, **layer_options),
+        "shapefile_path", OUTPUT_SHP_METADATA_CSV, ROOT_DIRS, inventory_db, footprint_output, profile_output,
+        extraction_key("shapefile", read_vector_layer_metadata, layer_options))
 
     print(f"shapefiles meta data printed successfully to {OUTPUT_SHP_METADATA_CSV}")
 
 # processing non spatial tabular data
-def process_csv_and_excel(ROOT_DIRS, OUTPUT_CSV_METADATA_CSV):
+def process_csv_and_excel(ROOT_DIRS, OUTPUT_CSV_METADATA_CSV, inventory=None, inventory_db=None, table_options=None, profile_output=None, footprint_output=None):
     # for CSV and EXCEL files
-    csv_paths = get_files_to_list(ROOT_DIRS, files_endwith=CSV_EXCEL_EXTENSIONS)
+    if inventory is None:
+        inventory = crawl_inventory(ROOT_DIRS)
+    csv_paths = inventory["table"]
+    table_options = {**(table_options or {}), "profile_columns": profile_output is not None}
 
     # get all csv and excel tables meta data
-    extract_table_metadata(csv_paths, OUTPUT_CSV_METADATA_CSV)
+    extract_incremental(
+        "table", csv_paths,
+        lambda paths: extract_table_metadata(paths, output_csv=None, **table_options),
+        "file_path", OUTPUT_CSV_METADATA_CSV, ROOT_DIRS, inventory_db, footprint_output, profile_output,
+        extraction_key("table", extract_table_metadata, table_options))
 
     print(f"csv and excel files meta data printed successfully to {OUTPUT_CSV_METADATA_CSV}")
 
 # processing images
-def process_images(ROOT_DIRS, OUTPUT_IMGS_METADATA_CSV):
+def process_images(ROOT_DIRS, OUTPUT_IMGS_METADATA_CSV, inventory=None, inventory_db=None, workers=1, footprint_output=None):
     ## for images
-    img_paths = get_files_to_list(ROOT_DIRS, files_endwith=IMAGES_EXTENSTIONS) 
-    extract_image_metadata(img_paths, OUTPUT_IMGS_METADATA_CSV)
+    if inventory is None:
+        inventory = crawl_inventory(ROOT_DIRS)
+    img_paths = inventory["image"]
+    extract_incremental(
+        "image", img_paths,
+        lambda paths: extract_image_metadata(paths, output_csv=None, workers=workers),
+        "image_path", OUTPUT_IMGS_METADATA_CSV, ROOT_DIRS, inventory_db, footprint_output,
+        options_key=extraction_key("image", extract_image_metadata, {}))
 
     print(f"Image files meta data printed successfully to {OUTPUT_IMGS_METADATA_CSV}") 
-
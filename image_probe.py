@@ -0,0 +1,477 @@
+import os
+import struct
+
+import pandas as pd
+from PIL import ExifTags
+
+
+# bytes read from the start of a file to identify its format
+SIGNATURE_BYTES = 16
+
+HEIF_BRANDS = {b"heic", b"heix", b"heim", b"heis", b"hevc", b"hevx", b"mif1", b"msf1"}
+
+# JPEG start-of-frame markers (0xC4, 0xC8 and 0xCC share the range but are not frames)
+JPEG_SOF_MARKERS = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+JPEG_MODES = {1: "L", 3: "RGB", 4: "CMYK"}
+PNG_MODES = {2: "RGB", 3: "P", 4: "LA", 6: "RGBA"}
+
+# TIFF field type: (struct format of one value, size in bytes)
+TIFF_TYPES = {
+    1: ("B", 1), 2: ("s", 1), 3: ("H", 2), 4: ("I", 4), 5: ("II", 8), 6: ("b", 1),
+    7: ("B", 1), 8: ("h", 2), 9: ("i", 4), 10: ("ii", 8), 11: ("f", 4), 12: ("d", 8),
+}
+EXIF_POINTER, GPS_POINTER = 0x8769, 0x8825
+
+# tags decoded from IFD0 and the Exif IFD; the GPS IFD is decoded whole
+IFD0_TAGS = {256, 257, 258, 262, 271, 272, 274, 277, 306, EXIF_POINTER, GPS_POINTER}
+EXIF_IFD_TAGS = {36867, 36868, 40962, 40963}
+
+# larger values (maker notes, thumbnails) are never read
+MAX_TAG_BYTES = 1024
+
+
+# function to read exactly size bytes
+def _read(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated image header")
+    return data
+
+
+# function to decode the value of one TIFF field
+def _decode_tiff_value(field_type, data, count, endian):
+    if field_type == 2:
+        return data.split(b"\0", 1)[0].decode("utf-8", "replace").strip()
+    if field_type == 7:
+        return data
+
+    fmt, _ = TIFF_TYPES[field_type]
+    values = struct.unpack(f"{endian}{fmt * count}", data)
+    if field_type in (5, 10):
+        values = tuple(
+            num / den if den else float("nan")
+            for num, den in zip(values[::2], values[1::2])
+        )
+    return values[0] if count == 1 else values
+
+
+# function to read the wanted fields of one image file directory
+def _read_ifd(f, base, offset, endian, wanted=None):
+    f.seek(base + offset)
+    (count,) = struct.unpack(f"{endian}H", _read(f, 2))
+    entries = _read(f, 12 * count)
+
+    fields = {}
+    for i in range(count):
+        tag, field_type, n, raw = struct.unpack(f"{endian}HHI4s", entries[12 * i:12 * i + 12])
+        if (wanted is not None and tag not in wanted) or field_type not in TIFF_TYPES:
+            continue
+
+        length = TIFF_TYPES[field_type][1] * n
+        if length > MAX_TAG_BYTES:
+            continue
+        if length > 4:
+            (pointer,) = struct.unpack(f"{endian}I", raw)
+            f.seek(base + pointer)
+            data = _read(f, length)
+        else:
+            data = raw[:length]
+
+        fields[tag] = _decode_tiff_value(field_type, data, n, endian)
+
+    return fields
+
+
+# function to read IFD0, the Exif IFD and the GPS IFD of a TIFF structure
+def read_tiff_tags(f, base=0):
+    """
+    Parses the TIFF structure starting at byte base of f (a TIFF or CR2
+    file, or the EXIF block of a JPEG/PNG/HEIF) by seeking to the fields
+    it needs.
+
+    Returns
+    -------
+    tuple[dict, dict, dict]
+        IFD0, Exif IFD and GPS IFD fields keyed by numeric tag
+    """
+    f.seek(base)
+    head = _read(f, 8)
+    if head[:4] not in (b"II*\0", b"MM\0*"):
+        raise ValueError("Invalid TIFF header")
+
+    endian = "<" if head[:2] == b"II" else ">"
+    (offset,) = struct.unpack(f"{endian}I", head[4:])
+
+    ifd0 = _read_ifd(f, base, offset, endian, IFD0_TAGS)
+    exif_ifd = _read_ifd(f, base, ifd0[EXIF_POINTER], endian, EXIF_IFD_TAGS) if EXIF_POINTER in ifd0 else {}
+    gps_ifd = _read_ifd(f, base, ifd0[GPS_POINTER], endian) if GPS_POINTER in ifd0 else {}
+
+    return ifd0, exif_ifd, gps_ifd
+
+
+# function to name the EXIF tags like PIL's _getexif does
+def named_exif(ifd0, exif_ifd, gps_ifd):
+    """Returns {tag name: value}, with the GPS IFD as {numeric GPS tag: value} under 'GPSInfo'"""
+    tags = {**ifd0, **exif_ifd}
+    exif = {
+        ExifTags.TAGS[tag]: value for tag, value in tags.items()
+        if tag in ExifTags.TAGS and tag not in (EXIF_POINTER, GPS_POINTER)
+    }
+    if gps_ifd:
+        exif["GPSInfo"] = gps_ifd
+    return exif
+
+
+# function to read the EXIF block embedded at base
+def _embedded_exif(f, base):
+    return named_exif(*read_tiff_tags(f, base)) or None
+
+
+# function to walk the boxes of an ISO base media file between start and end
+def _iter_boxes(f, start, end):
+    offset = start
+    while offset + 8 <= end:
+        f.seek(offset)
+        size, box_type = struct.unpack(">I4s", _read(f, 8))
+        header = 8
+        if size == 1:
+            (size,) = struct.unpack(">Q", _read(f, 8))
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header:
+            raise ValueError("Invalid box size")
+
+        yield box_type, offset + header, offset + size
+        offset += size
+
+
+# function to read a big-endian unsigned integer of size bytes (0 reads nothing)
+def _read_uint(f, size):
+    if size == 0:
+        return 0
+    return int.from_bytes(_read(f, size), "big")
+
+
+# function to parse a HEIF item location box
+def _heif_item_locations(f, start):
+    """Returns {item id: (construction method, file offset, length)} of each item's first extent"""
+    f.seek(start)
+    version = _read(f, 4)[0]
+    sizes = _read(f, 2)
+    offset_size, length_size = sizes[0] >> 4, sizes[0] & 15
+    base_offset_size, index_size = sizes[1] >> 4, (sizes[1] & 15 if version >= 1 else 0)
+    id_size = 2 if version < 2 else 4
+
+    locations = {}
+    for _ in range(_read_uint(f, id_size)):
+        item_id = _read_uint(f, id_size)
+        method = _read_uint(f, 2) & 15 if version >= 1 else 0
+        _read(f, 2)  # data reference index
+        base_offset = _read_uint(f, base_offset_size)
+
+        extents = []
+        for _ in range(_read_uint(f, 2)):
+            _read_uint(f, index_size)
+            extents.append((_read_uint(f, offset_size), _read_uint(f, length_size)))
+
+        if extents:
+            locations[item_id] = (method, base_offset + extents[0][0], extents[0][1])
+
+    return locations
+
+
+# function to parse a HEIF item property association box
+def _heif_property_associations(f, start):
+    """Returns {item id: [1-based property index, ...]}"""
+    f.seek(start)
+    version_flags = _read(f, 4)
+    version, wide = version_flags[0], version_flags[3] & 1
+
+    associations = {}
+    for _ in range(_read_uint(f, 4)):
+        item_id = _read_uint(f, 2 if version < 1 else 4)
+        count = _read(f, 1)[0]
+        mask = 0x7FFF if wide else 0x7F
+        associations[item_id] = [_read_uint(f, 2 if wide else 1) & mask for _ in range(count)]
+
+    return associations
+
+
+# function to parse the item info box into {item id: item type}
+def _heif_item_types(f, start, end):
+    f.seek(start)
+    version = _read(f, 4)[0]
+    entries_start = start + 4 + (2 if version == 0 else 4)
+
+    types = {}
+    for box_type, infe_start, _ in _iter_boxes(f, entries_start, end):
+        if box_type != b"infe":
+            continue
+        f.seek(infe_start)
+        infe_version = _read(f, 4)[0]
+        if infe_version < 2:
+            continue
+        item_id = _read_uint(f, 2 if infe_version == 2 else 4)
+        _read(f, 2)  # protection index
+        types[item_id] = _read(f, 4)
+
+    return types
+
+
+# function to probe a HEIF/HEIC image
+def probe_heif(f, file_size):
+    meta_box = None
+    for box_type, start, end in _iter_boxes(f, 0, file_size):
+        if box_type == b"meta":
+            meta_box = (start + 4, end)
+            break
+    if meta_box is None:
+        raise ValueError("No HEIF meta box")
+
+    primary, item_types, locations, properties, associations = None, {}, {}, [], {}
+    for box_type, start, end in _iter_boxes(f, *meta_box):
+        if box_type == b"pitm":
+            f.seek(start)
+            primary = _read_uint(f, 2 if _read(f, 4)[0] == 0 else 4)
+        elif box_type == b"iinf":
+            item_types = _heif_item_types(f, start, end)
+        elif box_type == b"iloc":
+            locations = _heif_item_locations(f, start)
+        elif box_type == b"iprp":
+            for child, child_start, child_end in _iter_boxes(f, start, end):
+                if child == b"ipco":
+                    properties = list(_iter_boxes(f, child_start, child_end))
+                elif child == b"ipma":
+                    associations.update(_heif_property_associations(f, child_start))
+
+    width = height = None
+    rotated = False
+    for index in associations.get(primary, []):
+        if not 0 < index <= len(properties):
+            continue
+        box_type, start, _ = properties[index - 1]
+        f.seek(start)
+        if box_type == b"ispe":
+            _read(f, 4)
+            width, height = struct.unpack(">II", _read(f, 8))
+        elif box_type == b"irot":
+            rotated = _read(f, 1)[0] & 1 == 1
+    if width is None:
+        raise ValueError("No HEIF image size")
+    if rotated:
+        width, height = height, width
+
+    exif = None
+    for item_id, item_type in item_types.items():
+        location = locations.get(item_id)
+        if item_type == b"Exif" and location and location[0] == 0:
+            f.seek(location[1])
+            # the Exif item starts with the offset of its TIFF header
+            exif = _embedded_exif(f, location[1] + 4 + _read_uint(f, 4))
+            break
+
+    return {"image_format": "HEIF", "color_mode": "RGB", "width_px": width, "height_px": height, "exif": exif}
+
+
+# function to probe a JPEG image
+def probe_jpeg(f):
+    f.seek(2)
+    exif = None
+
+    while True:
+        marker = _read(f, 2)
+        while marker == b"\xff\xff":  # fill bytes
+            marker = marker[1:] + _read(f, 1)
+        if marker[0] != 0xFF:
+            raise ValueError("Invalid JPEG marker")
+
+        code = marker[1]
+        if code == 0x01 or 0xD0 <= code <= 0xD8:
+            continue  # markers without a segment
+        if code in (0xD9, 0xDA):
+            raise ValueError("No JPEG frame header")
+
+        (length,) = struct.unpack(">H", _read(f, 2))
+        segment_end = f.tell() + length - 2
+
+        if code == 0xE1 and exif is None and _read(f, min(6, length - 2)) == b"Exif\0\0":
+            exif = _embedded_exif(f, f.tell())
+        elif code in JPEG_SOF_MARKERS:
+            _, height, width, components = struct.unpack(">BHHB", _read(f, 6))
+            return {
+                "image_format": "JPEG",
+                "color_mode": JPEG_MODES.get(components),
+                "width_px": width,
+                "height_px": height,
+                "exif": exif,
+            }
+
+        f.seek(segment_end)
+
+
+# function to probe a PNG image
+def probe_png(f):
+    f.seek(8)
+    header, exif = None, None
+
+    while True:
+        length, chunk_type = struct.unpack(">I4s", _read(f, 8))
+        chunk_end = f.tell() + length + 4  # data and CRC
+
+        if chunk_type == b"IHDR":
+            header = struct.unpack(">IIBB", _read(f, 10))
+        elif chunk_type == b"eXIf":
+            exif = _embedded_exif(f, f.tell())
+        elif chunk_type in (b"IDAT", b"IEND"):
+            break
+
+        f.seek(chunk_end)
+
+    if header is None:
+        raise ValueError("No PNG image header")
+
+    width, height, bit_depth, color_type = header
+    mode = {1: "1", 16: "I;16"}.get(bit_depth, "L") if color_type == 0 else PNG_MODES.get(color_type)
+    return {"image_format": "PNG", "color_mode": mode, "width_px": width, "height_px": height, "exif": exif}
+
+
+# function to probe a TIFF image or a Canon CR2 raw file
+def probe_tiff(f, head):
+    ifd0, exif_ifd, gps_ifd = read_tiff_tags(f)
+    if 256 not in ifd0 or 257 not in ifd0:
+        raise ValueError("No TIFF image size")
+
+    # CR2 is TIFF based; its IFD0 describes the full size preview
+    if head[8:10] == b"CR":
+        image_format, mode = "CR2", "RGB"
+    else:
+        image_format = "TIFF"
+        bits = ifd0.get(258, 1)
+        bits = bits[0] if isinstance(bits, tuple) else bits
+        samples = ifd0.get(277, 1)
+        mode = {
+            0: {1: "1", 16: "I;16"}.get(bits, "L"),
+            1: {1: "1", 16: "I;16"}.get(bits, "L"),
+            2: "RGBA" if samples == 4 else "RGB",
+            3: "P",
+            5: "CMYK",
+            6: "RGB",
+        }.get(ifd0.get(262))
+
+    return {
+        "image_format": image_format,
+        "color_mode": mode,
+        "width_px": ifd0[256],
+        "height_px": ifd0[257],
+        "exif": named_exif(ifd0, exif_ifd, gps_ifd) or None,
+    }
+
+
+# function to read the size, color mode and EXIF of an image from its header
+def probe_image(path):
+    """
+    Reads format, dimensions, color mode and EXIF of a JPEG, PNG, TIFF,
+    CR2 or HEIF/HEIC image by parsing its header structure. Only the
+    signature, the structure records on the way to the frame header and
+    the EXIF fields in use are read; pixel data and large tag values
+    (maker notes, thumbnails) are skipped.
+
+    Returns
+    -------
+    dict or None
+        image_format, color_mode, width_px, height_px and exif ({tag name:
+        value} as in PIL's _getexif, or None); None for other formats
+
+    Raises
+    ------
+    ValueError
+        If the header is truncated or malformed
+    """
+    with open(path, "rb") as f:
+        head = f.read(SIGNATURE_BYTES)
+
+        try:
+            if head.startswith(b"\xff\xd8"):
+                return probe_jpeg(f)
+            if head.startswith(b"\x89PNG\r\n\x1a\n"):
+                return probe_png(f)
+            if head[:4] in (b"II*\0", b"MM\0*"):
+                return probe_tiff(f, head)
+            if head[4:8] == b"ftyp" and head[8:12] in HEIF_BRANDS:
+                return probe_heif(f, os.fstat(f.fileno()).st_size)
+        except (struct.error, KeyError) as e:
+            raise ValueError(f"Malformed image header: {e}") from e
+
+    return None
+
+
+# function to turn an EXIF degrees/minutes/seconds value into decimal degrees
+def _gps_degrees(value, ref, negative_ref):
+    if value is None:
+        return None
+
+    parts = value if isinstance(value, tuple) else (value,)
+    degrees = sum(float(part) / 60 ** i for i, part in enumerate(parts[:3]))
+    if isinstance(ref, bytes):
+        ref = ref.decode("ascii", "replace")
+    if str(ref).strip().upper() == negative_ref:
+        degrees = -degrees
+    return degrees
+
+
+# function to decode the EXIF GPS IFD
+def decode_gps_info(gps):
+    """
+    Decodes a GPSInfo dict ({numeric GPS tag: value}, from probe_image or
+    PIL) into WGS84 decimal degrees, metres above sea level and the UTC fix
+    time.
+
+    Fixes flagged void (GPSStatus 'V'), outside the valid ranges or at
+    exactly 0, 0 (written by cameras without a fix) are dropped.
+
+    Returns
+    -------
+    dict
+        gps_latitude, gps_longitude, gps_altitude (None when missing) and
+        gps_timestamp (naive UTC pd.Timestamp or None)
+    """
+    decoded = {"gps_latitude": None, "gps_longitude": None, "gps_altitude": None, "gps_timestamp": None}
+    if not gps:
+        return decoded
+
+    try:
+        latitude = _gps_degrees(gps.get(2), gps.get(1), "S")
+        longitude = _gps_degrees(gps.get(4), gps.get(3), "W")
+    except (TypeError, ValueError, ZeroDivisionError):
+        latitude = longitude = None
+
+    status = gps.get(9)
+    void = (status.decode("ascii", "replace") if isinstance(status, bytes) else str(status or "")).strip().upper() == "V"
+
+    if (
+        latitude is not None and longitude is not None and not void
+        and abs(latitude) <= 90 and abs(longitude) <= 180
+        and (latitude, longitude) != (0, 0)
+    ):
+        decoded["gps_latitude"], decoded["gps_longitude"] = latitude, longitude
+
+    try:
+        altitude = float(gps[6])
+        # GPSAltitudeRef 1 means below sea level (stored as a byte or an int)
+        below = gps.get(5) in (1, b"\x01")
+        if altitude == altitude:  # not NaN
+            decoded["gps_altitude"] = -altitude if below else altitude
+    except (KeyError, TypeError, ValueError):
+        pass
+
+    try:
+        hours, minutes, seconds = (float(part) for part in gps[7])
+        date = pd.to_datetime(str(gps[29]).strip(), format="%Y:%m:%d")
+        timestamp = date + pd.Timedelta(hours=hours, minutes=minutes, seconds=seconds)
+        if not pd.isna(timestamp):
+            decoded["gps_timestamp"] = timestamp
+    except (KeyError, TypeError, ValueError):
+        pass
+
+    return decoded
@@ -0,0 +1,207 @@
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+import pandas as pd
+
+
+# Sidecar files that change a shapefile's content without touching the .shp
+SHAPEFILE_SIDECARS = [".dbf", ".shx", ".prj", ".cpg"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS inventory (
+    doc_type     TEXT NOT NULL,
+    path         TEXT NOT NULL,
+    size         INTEGER,
+    mtime_ns     INTEGER,
+    inode        INTEGER,
+    status       TEXT NOT NULL,
+    rows_json    TEXT,
+    extracted_at TEXT,
+    removed_at   TEXT,
+    options_key  TEXT,
+    PRIMARY KEY (doc_type, path)
+)
+"""
+
+
+# function to build the change signature of a file or geodatabase folder
+def path_signature(path):
+    """
+    Returns (size, mtime_ns, inode) for a document.
+
+    Geodatabase folders are summarised over the files they contain and
+    shapefiles include their sidecar files, so an edit to any part of
+    the dataset changes the signature.
+    """
+    st = os.stat(path)
+    size, mtime_ns = st.st_size, st.st_mtime_ns
+
+    if os.path.isdir(path):
+        size = 0
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_file():
+                    entry_st = entry.stat()
+                    size += entry_st.st_size
+                    mtime_ns = max(mtime_ns, entry_st.st_mtime_ns)
+
+    elif path.lower().endswith(".shp"):
+        stem = os.path.splitext(path)[0]
+        for ext in SHAPEFILE_SIDECARS:
+            if os.path.exists(stem + ext):
+                sidecar_st = os.stat(stem + ext)
+                size += sidecar_st.st_size
+                mtime_ns = max(mtime_ns, sidecar_st.st_mtime_ns)
+
+    return size, mtime_ns, st.st_ino
+
+
+# function to test whether a path lies under a scanned root
+def _is_under(path, root):
+    """Compares whole path components, so D:\\data2 is not under D:\\data"""
+    path, root = os.path.normcase(os.path.normpath(path)), os.path.normcase(os.path.normpath(root))
+    try:
+        return os.path.commonpath([path, root]) == root
+    except ValueError:  # different drives, or an absolute and a relative path
+        return False
+
+
+class InventoryCache:
+    """
+    Persistent file inventory kept in a SQLite file next to the outputs.
+
+    Every extracted document is stored with its size/mtime/inode
+    signature, the key of the extraction options and row schema it was
+    extracted with, and its metadata rows, so a re-run only extracts new
+    or changed documents (or documents extracted with other options) and
+    reuses the cached rows for everything else. Documents that disappear
+    from the scanned roots are kept as 'removed' rows.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = str(db_path)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute(SCHEMA)
+
+        # inventories written before options were recorded: their rows are re-extracted once
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(inventory)")}
+        if "options_key" not in columns:
+            self.conn.execute("ALTER TABLE inventory ADD COLUMN options_key TEXT")
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def plan(self, doc_type, paths, root_dirs, options_key=None):
+        """
+        Compares the crawled paths against the inventory.
+
+        Paths cached under another options_key (extraction options or row
+        schema version, see helper_functions.extraction_key) count as
+        changed.
+
+        Returns
+        -------
+        changed : list[str]
+            New or modified paths that need extracting
+        unchanged : list[str]
+            Paths whose cached rows can be reused
+        removed : list[str]
+            Known paths under root_dirs that no longer exist
+        signatures : dict[str, tuple]
+            Current signature of every crawled path
+        """
+        known = {
+            path: (size, mtime_ns, inode, status, key)
+            for path, size, mtime_ns, inode, status, key in self.conn.execute(
+                "SELECT path, size, mtime_ns, inode, status, options_key FROM inventory WHERE doc_type = ?",
+                (doc_type,),
+            )
+        }
+
+        changed, unchanged, signatures = [], [], {}
+
+        for path in paths:
+            try:
+                signatures[path] = path_signature(path)
+            except OSError:
+                changed.append(path)  # let the extractor report the error
+                continue
+
+            cached = known.get(path)
+            if (cached and cached[3] == "present" and tuple(cached[:3]) == signatures[path]
+                    and cached[4] == options_key):
+                unchanged.append(path)
+            else:
+                changed.append(path)
+
+        crawled = set(paths)
+        removed = [
+            path for path in known
+            if path not in crawled
+            and any(_is_under(path, root) for root in root_dirs)
+        ]
+
+        return changed, unchanged, removed, signatures
+
+    def store(self, doc_type, meta_df, path_column, signatures, options_key=None):
+        """
+        Saves freshly extracted rows.
+
+        Failed rows are cached too, so a document that fails the same way
+        every time (no features, no CRS...) is only retried once its
+        signature or options key changes. Paths with skipped rows (access
+        errors, often transient on network shares) are retried next run.
+        """
+        if meta_df.empty:
+            return
+
+        now = datetime.now().isoformat(timespec="seconds")
+
+        for path, rows in meta_df.groupby(path_column, sort=False):
+            if (rows["status"] == "skipped").any() or path not in signatures:
+                continue
+
+            size, mtime_ns, inode = signatures[path]
+            # timestamps are kept as plain "YYYY-MM-DD HH:MM:SS" text, as in the CSV outputs (NaT as null)
+            rows = rows.map(
+                lambda v: (None if pd.isna(v) else v.isoformat(sep=" ")) if isinstance(v, datetime) else v
+            )
+            rows_json = rows.to_json(orient="records", default_handler=str)
+
+            self.conn.execute(
+                "INSERT OR REPLACE INTO inventory VALUES (?, ?, ?, ?, ?, 'present', ?, ?, NULL, ?)",
+                (doc_type, path, size, mtime_ns, inode, rows_json, now, options_key),
+            )
+        self.conn.commit()
+
+    def load_rows(self, doc_type, paths):
+        """Returns the cached metadata rows of the given paths"""
+        records = []
+        for path in paths:
+            (rows_json,) = self.conn.execute(
+                "SELECT rows_json FROM inventory WHERE doc_type = ? AND path = ?",
+                (doc_type, path),
+            ).fetchone()
+            records.extend(json.loads(rows_json))
+
+        return pd.DataFrame(records)
+
+    def mark_removed(self, doc_type, paths):
+        """Flags deleted paths and returns their last known rows with status 'removed'"""
+        now = datetime.now().isoformat(timespec="seconds")
+
+        self.conn.executemany(
+            "UPDATE inventory SET status = 'removed', removed_at = COALESCE(removed_at, ?) "
+            "WHERE doc_type = ? AND path = ?",
+            [(now, doc_type, path) for path in paths],
+        )
+        self.conn.commit()
+
+        removed_df = self.load_rows(doc_type, paths)
+        if not removed_df.empty:
+            removed_df["status"] = "removed"
+            removed_df["error"] = None
+        return removed_df
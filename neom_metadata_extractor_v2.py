@@ -7,6 +7,8 @@ from tqdm import tqdm
 import pandas as pd
 from datetime import datetime
 import helper_functions
+import catalog_query
+import shapely
 
 
 st.set_page_config(page_title="Neom Metadata Extractor v2", layout="centered")
@@ -72,11 +74,73 @@ base_name = st.text_input(
 st.markdown("**Generated files:**")
 st.code(f"""
 {base_name}_gdb_layer_metadata.csv
+{base_name}_gdb_layer_footprints.gpkg
 {base_name}_shp_layer_metadata.csv
+{base_name}_shp_layer_footprints.gpkg
 {base_name}_csv_xlsx_tables_metadata.csv
+{base_name}_csv_xlsx_point_footprints.gpkg
+{base_name}_*_column_profiles.csv  (when column profiling is on)
 {base_name}_images_layer_metadata.csv
+{base_name}_images_photo_points.gpkg
 """)
 
+# -----------------------------
+# Performance Options
+# -----------------------------
+with st.expander("⚙️ Performance options"):
+    crawl_workers = st.number_input(
+        "Directory, layer listing and image threads",
+        min_value=1,
+        max_value=64,
+        value=1,
+        help="Use more threads to speed up scanning folders, geodatabases and images on network drives (SMB/NFS)",
+    )
+    incremental = st.checkbox(
+        "Only extract new or changed files",
+        value=True,
+        help="Keeps an inventory next to the outputs and reuses results for unchanged files",
+    )
+    gdb_workers = st.number_input(
+        "Geodatabase worker processes",
+        min_value=1,
+        max_value=os.cpu_count() or 1,
+        value=1,
+        help="Extract geodatabase layers on several CPU cores",
+    )
+    geo_mode = st.radio(
+        "Geospatial metadata mode",
+        options=["full", "fast", "sample"],
+        horizontal=True,
+        help="'fast' reads counts and fields from the layer header and only loads geometry "
+             "(memory_mb is left empty) and counts CSV lines without parsing them; "
+             "'sample' estimates from 10,000 features per layer and 10,000 rows per CSV "
+             "(rows flagged as estimated)",
+    )
+    streaming_obb = st.checkbox(
+        "Stream geometry in chunks (bounded memory)",
+        value=False,
+        help="Builds the oriented bounding box from a running convex hull, "
+             "reading 100,000 features at a time in fast mode",
+    )
+    footprint_reprojection = st.checkbox(
+        "Reproject only the footprint",
+        value=False,
+        help="EPSG:4326 layers are measured in degrees and only their convex hull is "
+             "transformed to the project CRS (bbox becomes approximate)",
+    )
+    profile_columns = st.checkbox(
+        "Profile columns",
+        value=False,
+        help="Writes null counts, min/max and approximate distinct counts of every "
+             "attribute and table column to separate *_column_profiles.csv files",
+    )
+    skip_duplicates = st.checkbox(
+        "Reuse results for duplicate layers",
+        value=False,
+        help="Layers with the same fingerprint (count, bounds, fields and sampled geometry) "
+             "copy the metadata of the first copy instead of being read again",
+    )
+
 # -----------------------------
 # Review Settings
 # -----------------------------
@@ -113,31 +177,128 @@ if run:
             "CSV AND EXCEL": Path(output_dir) / f"{base_name}_csv_xlsx_tables_metadata.csv",
             "IMAGES": Path(output_dir) / f"{base_name}_images_layer_metadata.csv",
         }
+        layer_options = {
+            "mode": geo_mode,
+            "obb_method": "hull" if streaming_obb else "union",
+            "chunk_size": 100_000 if streaming_obb else None,
+            "reproject": "footprint" if footprint_reprojection else "layer",
+            "skip_duplicates": skip_duplicates,
+        }
+        inventory_db = Path(output_dir) / f"{base_name}_inventory.sqlite" if incremental else None
+        profile_paths = {
+            "GEODATABASES": Path(output_dir) / f"{base_name}_gdb_column_profiles.csv",
+            "SHAPEFILES": Path(output_dir) / f"{base_name}_shp_column_profiles.csv",
+            "CSV AND EXCEL": Path(output_dir) / f"{base_name}_csv_xlsx_column_profiles.csv",
+        } if profile_columns else {}
 
         st.success("Metadata extraction started")
 
         with st.spinner("Extracting metadata..."):
+            # walk the root folder once and share it across all data types
+            inventory = helper_functions.crawl_inventory([root_dir], workers=int(crawl_workers))
+
             if "GEODATABASES" in document_types:
                 helper_functions.process_geodatabases(
                     ROOT_DIRS=[root_dir],
-                    OUTPUT_GDB_METADATA_CSV=output_paths["GEODATABASES"])
+                    OUTPUT_GDB_METADATA_CSV=output_paths["GEODATABASES"],
+                    inventory=inventory,
+                    inventory_db=inventory_db,
+                    workers=int(gdb_workers),
+                    listing_workers=int(crawl_workers),
+                    layer_options=layer_options,
+                    footprint_output=Path(output_dir) / f"{base_name}_gdb_layer_footprints.gpkg",
+                    profile_output=profile_paths.get("GEODATABASES"))
                 
             if "SHAPEFILES" in document_types:
                 helper_functions.process_shapefiles(
                     ROOT_DIRS=[root_dir],
-                    OUTPUT_SHP_METADATA_CSV=output_paths["SHAPEFILES"]
+                    OUTPUT_SHP_METADATA_CSV=output_paths["SHAPEFILES"],
+                    inventory=inventory,
+                    inventory_db=inventory_db,
+                    layer_options=layer_options,
+                    footprint_output=Path(output_dir) / f"{base_name}_shp_layer_footprints.gpkg",
+                    profile_output=profile_paths.get("SHAPEFILES")
                 )
 
             if "CSV AND EXCEL" in document_types:
                 helper_functions.process_csv_and_excel(
                     ROOT_DIRS=[root_dir],
-                    OUTPUT_CSV_METADATA_CSV=output_paths["CSV AND EXCEL"]
+                    OUTPUT_CSV_METADATA_CSV=output_paths["CSV AND EXCEL"],
+                    inventory=inventory,
+                    inventory_db=inventory_db,
+                    table_options={"mode": geo_mode},
+                    profile_output=profile_paths.get("CSV AND EXCEL"),
+                    footprint_output=Path(output_dir) / f"{base_name}_csv_xlsx_point_footprints.gpkg"
                 )
 
             if "IMAGES" in document_types:
                 helper_functions.process_images(
                     ROOT_DIRS=[root_dir],
-                    OUTPUT_IMGS_METADATA_CSV=output_paths["IMAGES"]
+                    OUTPUT_IMGS_METADATA_CSV=output_paths["IMAGES"],
+                    inventory=inventory,
+                    inventory_db=inventory_db,
+                    workers=int(crawl_workers),
+                    footprint_output=Path(output_dir) / f"{base_name}_images_photo_points.gpkg"
                 )
 
         st.success("Metadata extraction completed ✅")
+
+# -----------------------------
+# Area of Interest Query
+# -----------------------------
+st.divider()
+st.subheader("6️⃣ Find Datasets in an Area")
+st.caption("Searches the geodatabase, shapefile and point table footprints and the geotagged photos in the output folder")
+
+aoi_wkt = st.text_area(
+    "Area of interest (WKT polygon, longitude/latitude)",
+    value="",
+    help="Leave empty to search with the bounding box below",
+)
+aoi_cols = st.columns(4)
+aoi_bbox = [
+    aoi_cols[0].number_input("Min longitude", value=34.5, format="%.4f"),
+    aoi_cols[1].number_input("Min latitude", value=27.5, format="%.4f"),
+    aoi_cols[2].number_input("Max longitude", value=36.0, format="%.4f"),
+    aoi_cols[3].number_input("Max latitude", value=29.0, format="%.4f"),
+]
+use_time_range = st.checkbox("Limit to a time range", value=False)
+time_cols = st.columns(2)
+time_start = time_cols[0].date_input("From", value=None, disabled=not use_time_range)
+time_end = time_cols[1].date_input("To", value=None, disabled=not use_time_range)
+search = st.button("🔎 Find overlapping datasets", use_container_width=True)
+
+if search:
+    if not output_dir:
+        st.error("Please provide an output folder")
+    else:
+        catalog = catalog_query.FootprintCatalog.from_outputs([
+            (Path(output_dir) / f"{base_name}_gdb_layer_metadata.csv",
+             Path(output_dir) / f"{base_name}_gdb_layer_footprints.gpkg"),
+            (Path(output_dir) / f"{base_name}_shp_layer_metadata.csv",
+             Path(output_dir) / f"{base_name}_shp_layer_footprints.gpkg"),
+            (Path(output_dir) / f"{base_name}_csv_xlsx_tables_metadata.csv",
+             Path(output_dir) / f"{base_name}_csv_xlsx_point_footprints.gpkg"),
+            (Path(output_dir) / f"{base_name}_images_layer_metadata.csv",
+             Path(output_dir) / f"{base_name}_images_photo_points.gpkg"),
+        ])
+
+        # the end date is inclusive: keep everything before the next midnight
+        time_range = {}
+        if use_time_range:
+            time_range = {
+                "start": time_start,
+                "end": pd.Timestamp(time_end) + pd.Timedelta(days=1) - pd.Timedelta(seconds=1) if time_end else None,
+            }
+
+        if len(catalog) == 0:
+            st.warning("No footprints found, run a geodatabase, shapefile, table or image extraction first")
+        else:
+            if aoi_wkt.strip():
+                matches = catalog.query(shapely.from_wkt(aoi_wkt), crs=4326, **time_range)
+            else:
+                matches = catalog.query_bbox(*aoi_bbox, crs=4326, **time_range)
+
+            st.write(f"**{len(matches)}** of {len(catalog)} layers and photos overlap the area")
+            shown = ["source", "dataset", "layer", "sheet_name", "feature_count", "min_date", "max_date", "captured_time"]
+            st.dataframe(matches[[c for c in shown if c in matches.columns]])
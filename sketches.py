@@ -0,0 +1,178 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+
+# function to merge the dtypes pandas inferred for two chunks of a column
+def merge_dtypes(left, right):
+    """Returns the dtype holding both: numeric types are promoted, anything else mixed becomes object"""
+    if left == right:
+        return left
+
+    numeric = (pd.api.types.is_numeric_dtype(left) and pd.api.types.is_numeric_dtype(right)
+               and not pd.api.types.is_bool_dtype(left) and not pd.api.types.is_bool_dtype(right))
+    if numeric:
+        return np.promote_types(left, right)
+    return np.dtype(object)
+
+
+class HyperLogLog:
+    """
+    Mergeable approximate distinct counter.
+
+    Values are hashed with pandas' vectorized hashing; the first p bits of
+    each hash pick a register and the register keeps the longest run of
+    leading zeros seen in the remaining bits. With p=12 (4096 one-byte
+    registers) the standard error is about 1.6%.
+
+    Numbers (and booleans) are hashed as float64, so 5 and 5.0 count once
+    whichever dtype each chunk of a column was read with.
+    """
+
+    def __init__(self, p=12):
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    def add(self, values):
+        """Adds a pd.Series (or array) of non-null values"""
+        if len(values) == 0:
+            return
+
+        values = pd.Series(values)
+        if pd.api.types.is_numeric_dtype(values.dtype):
+            values = values.astype(np.float64)
+
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        index = (hashes >> np.uint64(64 - self.p)).astype(np.intp)
+        rest = hashes & np.uint64((1 << (64 - self.p)) - 1)
+
+        # rank = position of the first set bit; frexp gives the bit length exactly below 2**53
+        bit_length = np.frexp(rest.astype(np.float64))[1]
+        rank = (64 - self.p - bit_length + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other):
+        """Folds another sketch with the same precision into this one"""
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self):
+        """Returns the estimated number of distinct values"""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)  # linear counting for small cardinalities
+
+        return int(round(estimate))
+
+
+# function to turn a numpy/pandas scalar into a JSON friendly value
+def _plain(value, dtype=None):
+    if value is None:
+        return None
+    if dtype is not None and pd.api.types.is_float_dtype(dtype) and not isinstance(value, (bool, np.bool_)):
+        # chunks read as integers report their extremes like the merged float column
+        value = float(value)
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return str(pd.Timestamp(value))
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class ColumnProfile:
+    """Running row/null counters, min/max and a distinct count sketch of one column"""
+
+    def __init__(self, name, dtype):
+        self.name = name
+        self.dtype = dtype
+        self.row_count = 0
+        self.null_count = 0
+        self.min = None
+        self.max = None
+        self.comparable = True
+        self.distinct = HyperLogLog()
+
+    def update(self, series):
+        self.dtype = merge_dtypes(self.dtype, series.dtype)
+        values = series.dropna()
+        self.row_count += len(series)
+        self.null_count += len(series) - len(values)
+
+        if values.empty:
+            return
+        self.distinct.add(values)
+
+        if self.comparable:
+            try:
+                low, high = values.min(), values.max()
+                self.min = low if self.min is None else min(self.min, low)
+                self.max = high if self.max is None else max(self.max, high)
+            except TypeError:
+                # mixed types (e.g. numbers and text) have no order
+                self.comparable = False
+                self.min = self.max = None
+
+    def merge(self, other):
+        self.dtype = merge_dtypes(self.dtype, other.dtype)
+        self.row_count += other.row_count
+        self.null_count += other.null_count
+        self.distinct.merge(other.distinct)
+
+        self.comparable = self.comparable and other.comparable
+        try:
+            if other.min is not None:
+                self.min = other.min if self.min is None else min(self.min, other.min)
+                self.max = other.max if self.max is None else max(self.max, other.max)
+        except TypeError:
+            self.comparable = False
+        if not self.comparable:
+            self.min = self.max = None
+
+    def to_record(self):
+        return {
+            "column": self.name,
+            "dtype": str(self.dtype),
+            "rows_profiled": self.row_count,
+            "null_count": self.null_count,
+            "min": _plain(self.min, self.dtype),
+            "max": _plain(self.max, self.dtype),
+            # the estimate can overshoot slightly; there are never more distinct than non-null values
+            "distinct_count": min(self.distinct.count(), self.row_count - self.null_count),
+        }
+
+
+class TableProfile:
+    """
+    Column profiles of a table, updated chunk by chunk.
+
+    Each chunk only updates fixed-size counters and sketches, so profiling
+    a file costs no more memory than reading one chunk of it, and profiles
+    of several chunks or files can be merged.
+    """
+
+    def __init__(self):
+        self.columns = {}
+
+    def update(self, df):
+        for name, series in df.items():
+            if name not in self.columns:
+                self.columns[name] = ColumnProfile(name, series.dtype)
+            self.columns[name].update(series)
+
+    def merge(self, other):
+        for name, column in other.columns.items():
+            if name in self.columns:
+                self.columns[name].merge(column)
+            else:
+                self.columns[name] = column
+
+    def to_records(self):
+        return [column.to_record() for column in self.columns.values()]
+
+    def to_json(self):
+        return json.dumps(self.to_records(), default=str)